@@ -4,6 +4,7 @@
 星露谷翻译工具 - 简化版 Nuitka 打包脚本
 打包为单个可执行文件,资源文件夹外置,无控制台窗口
 """
+import os
 import subprocess
 import sys
 import shutil
@@ -13,18 +14,29 @@ from version import VERSION
 
 def check_nuitka():
     """检查 Nuitka 是否可用"""
+    # 直接在当前进程中读取版本号,省去启动一个新解释器的开销
     try:
-        result = subprocess.run([sys.executable, '-m', 'nuitka', '--version'],
-                                capture_output=True, text=True, encoding='utf-8', errors='ignore')
-        if result.returncode == 0:
-            print(f"[OK] Nuitka: {result.stdout.splitlines()[0]}")
-            return True
-        else:
-            print("[ERROR] Nuitka 未安装或不可用")
-            return False
-    except:
+        from nuitka.Version import getNuitkaVersion
+        print(f"[OK] Nuitka: {getNuitkaVersion()}")
+        return True
+    except ImportError:
         print("[ERROR] Nuitka 未安装")
         return False
+    except Exception:
+        print("[ERROR] Nuitka 未安装或不可用")
+        return False
+
+
+def fast_rmtree(path):
+    """删除目录树,Windows 上使用原生 rmdir 避免逐文件的 Python 调用"""
+    if not path.exists():
+        return
+    if sys.platform == 'win32':
+        rc = subprocess.run(['cmd', '/c', 'rmdir', '/s', '/q', str(path)], check=False).returncode
+        if rc == 0 and not path.exists():
+            return
+        # rmdir 失败(文件被占用、exe 仍在运行等)时回退到 shutil.rmtree,仍失败则抛出异常
+    shutil.rmtree(path)
 
 
 def build():
@@ -47,7 +59,7 @@ def build():
         print("=" * 60)
         print("正在清理 dist 目录...")
         try:
-            shutil.rmtree(dist_dir)
+            fast_rmtree(dist_dir)
             print("dist 目录清理完成")
         except Exception as e:
             print(f"清理 dist 目录时出错: {e}")
@@ -60,10 +72,9 @@ def build():
         "-m", "nuitka",
         "--standalone",  # 独立模式
         "--onefile",  # 打包为单文件
-        "--windows-disable-console",  # 禁用控制台窗口
+        "--windows-console-mode=disable",  # 禁用控制台窗口
         "--enable-plugin=pyside6",  # 启用 PySide6 插件
         f"--windows-icon-from-ico={icon_file}",  # 设置图标
-        "--lto=yes",  # 启用链接时优化(压缩)
         # "--include-data-dir=resources=resources",  # 不包含resources文件夹
         "--output-dir=dist",  # 输出目录
         f"--output-filename={output_filename}",  # 输出文件名
@@ -72,12 +83,31 @@ def build():
         f"--file-version={VERSION}",
         f"--product-version={VERSION}",
         "--file-description=Stardew Valley Translation Tool",
+        "--python-flag=no_site,no_warnings,no_asserts",  # 精简启动流程
+        "--python-flag=isolated",  # 忽略用户环境变量和用户 site 目录
         "--assume-yes-for-downloads",  # 自动确认下载
+        f"--jobs={os.cpu_count() or 1}",  # 并行编译 C 代码
         "--show-progress",  # 显示进度
         "--show-memory",  # 显示内存使用
         str(main_file)
     ]
 
+    # 静态链接 libpython 可避免未编译标准库模块变慢;Windows 版 Python 不提供 libpython.a
+    if sys.platform != 'win32':
+        cmd.insert(-1, "--static-libpython=yes")
+
+    # 链接时优化耗时很长且对本工具运行速度几乎无益,仅在发布构建时启用
+    if os.environ.get('RELEASE_BUILD'):
+        cmd.insert(-1, "--lto=yes")
+    elif os.environ.get('PGO_BUILD'):
+        cmd.insert(-1, "--lto=auto")
+    else:
+        cmd.insert(-1, "--lto=no")
+
+    # PGO:先构建插桩版本,用 --self-test 跑一遍训练流程,再根据采样结果重新构建
+    if os.environ.get('PGO_BUILD'):
+        cmd[-1:-1] = ["--pgo-c", "--pgo-args=--self-test"]
+
     print("=" * 60)
     print("开始打包...")
     print("=" * 60)
@@ -87,8 +117,12 @@ def build():
     print("=" * 60)
 
     try:
+        # 使用持久化缓存目录,增量构建时可命中 ccache
+        env = os.environ.copy()
+        env['NUITKA_CACHE_DIR'] = str(project_root / '.nuitka-cache')
+
         # 执行打包命令
-        result = subprocess.run(cmd, cwd=project_root, check=True)
+        result = subprocess.run(cmd, cwd=project_root, env=env, check=True)
 
         print("\n" + "=" * 60)
         print("打包完成!")
@@ -102,9 +136,18 @@ def build():
             print("=" * 60)
             print("正在复制 resources 文件夹...")
             try:
-                if resources_dst.exists():
-                    shutil.rmtree(resources_dst)
-                shutil.copytree(resources_src, resources_dst)
+                if sys.platform == 'win32':
+                    # robocopy /MIR 自带镜像清理,多线程复制比 copytree 快得多
+                    rc = subprocess.run([
+                        'robocopy', str(resources_src), str(resources_dst),
+                        '/MIR', '/MT:16', '/NDL', '/NFL', '/NJH', '/NJS', '/R:1', '/W:1'
+                    ]).returncode
+                    # robocopy 返回码 0-7 均表示成功
+                    if rc > 7:
+                        raise RuntimeError(f"robocopy 返回错误码 {rc}")
+                else:
+                    fast_rmtree(resources_dst)
+                    shutil.copytree(resources_src, resources_dst)
                 print(f"resources 文件夹已复制到: {resources_dst}")
             except Exception as e:
                 print(f"复制 resources 文件夹时出错: {e}")
@@ -2,26 +2,89 @@
 API客户端抽象类和具体实现
 支持多个API提供商
 """
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Type
 import requests
+from requests.adapters import HTTPAdapter
 from core.config import config
 
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库
+    orjson = None
+
 
 class APIClient(ABC):
     """API客户端抽象基类"""
     
+    # 是否发送 Authorization 头 / 是否走代理，子类按需覆盖
+    USE_AUTH = True
+    USE_PROXIES = True
+    
     def __init__(self, api_key: str, base_url: str, model: str, temperature: float = 0.3, timeout: int = 120):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
+        self._session = self._create_session()
+        self._proxies = None
+        self.refresh()
+        
+        # 请求头和请求体模板只构建一次，每次调用只填入新的消息列表
+        self._headers = {"Content-Type": "application/json"}
+        if self.USE_AUTH:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+        self._data_template = {
+            "model": self.model,
+            "messages": None,
+            "temperature": self.temperature,
+            "stream": False
+        }
+    
+    def refresh(self):
+        """重新读取代理配置（配置在运行期间变化时调用）"""
+        if self.USE_PROXIES and hasattr(config, 'get_proxies'):
+            self._proxies = config.get_proxies()
+        else:
+            self._proxies = None
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """创建复用连接的会话，批量翻译时避免每次请求都重新握手"""
+        session = requests.Session()
+        # 重试由 TranslationEngine 按 max_retries 配置处理，这里只负责连接池
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
     
-    @abstractmethod
     def call_api(self, prompt: str) -> str:
         """调用API进行翻译"""
-        pass
+        # 每次调用构建独立的请求体，不修改共享模板，允许多个线程同时调用
+        data = {**self._data_template, "messages": [{"role": "user", "content": prompt}]}
+        if orjson is not None:
+            body = orjson.dumps(data)
+        else:
+            body = json.dumps(data).encode("utf-8")
+
+        response = self._session.post(
+            self.base_url,
+            headers=self._headers,
+            data=body,
+            timeout=self.timeout,
+            proxies=self._proxies
+        )
+        response.raise_for_status()
+
+        # 接口固定返回 UTF-8，直接解析原始字节，跳过 requests 的编码探测
+        if orjson is not None:
+            result = orjson.loads(response.content)
+        else:
+            result = json.loads(response.content)
+        return result["choices"][0]["message"]["content"]
     
     @abstractmethod
     def get_name(self) -> str:
@@ -34,37 +97,6 @@ class SiliconFlowClient(APIClient):
     
     def get_name(self) -> str:
         return "硅基流动"
-    
-    def call_api(self, prompt: str) -> str:
-        """调用硅基流动API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.temperature,
-            "stream": False
-        }
-
-        response = requests.post(
-            self.base_url,
-            headers=headers,
-            json=data,
-            timeout=self.timeout,
-            proxies=config.get_proxies() if hasattr(config, 'get_proxies') else None
-        )
-        response.raise_for_status()
-
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
 
 
 class DeepSeekClient(APIClient):
@@ -72,76 +104,19 @@ class DeepSeekClient(APIClient):
     
     def get_name(self) -> str:
         return "DeepSeek官网"
-    
-    def call_api(self, prompt: str) -> str:
-        """调用DeepSeek官网API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.temperature,
-            "stream": False
-        }
-
-        response = requests.post(
-            self.base_url,
-            headers=headers,
-            json=data,
-            timeout=self.timeout,
-            proxies=config.get_proxies() if hasattr(config, 'get_proxies') else None
-        )
-        response.raise_for_status()
-
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
 
 
 class LocalAPIClient(APIClient):
     """本地API客户端 (如 LM Studio)"""
     
+    USE_AUTH = False
+    USE_PROXIES = False
+    
     def __init__(self, api_key: str, base_url: str, model: str, temperature: float = 0.3, timeout: int = 180):
         super().__init__(api_key, base_url, model, temperature, timeout)
     
     def get_name(self) -> str:
         return "本地API"
-    
-    def call_api(self, prompt: str) -> str:
-        """调用本地API (如 LM Studio)"""
-        headers = {
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.temperature,
-            "stream": False
-        }
-
-        response = requests.post(
-            self.base_url,
-            headers=headers,
-            json=data,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
 
 
 class OpenAICompatibleClient(APIClient):
@@ -153,99 +128,49 @@ class OpenAICompatibleClient(APIClient):
     
     def get_name(self) -> str:
         return self.provider_name
-    
-    def call_api(self, prompt: str) -> str:
-        """调用OpenAI兼容API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.temperature,
-            "stream": False
-        }
 
-        response = requests.post(
-            self.base_url,
-            headers=headers,
-            json=data,
-            timeout=self.timeout,
-            proxies=config.get_proxies() if hasattr(config, 'get_proxies') else None
-        )
-        response.raise_for_status()
 
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+class Provider(NamedTuple):
+    """API提供商信息"""
+    name: str
+    cls: Type[APIClient]
+    default_url: str
+    default_model: str
 
 
 class APIClientFactory:
     """API客户端工厂类"""
     
-    # 预定义的API提供商配置
-    PROVIDERS = {
-        "siliconflow": {
-            "name": "硅基流动",
-            "class": SiliconFlowClient,
-            "default_url": "https://api.siliconflow.cn/v1/chat/completions",
-            "default_model": "deepseek-ai/DeepSeek-V3"
-        },
-        "deepseek": {
-            "name": "DeepSeek官网",
-            "class": DeepSeekClient,
-            "default_url": "https://api.deepseek.com/v1/chat/completions",
-            "default_model": "deepseek-chat"
-        },
-        "openai": {
-            "name": "OpenAI",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://api.openai.com/v1/chat/completions",
-            "default_model": "gpt-4o-mini"
-        },
-        "qwen": {
-            "name": "通义千问",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-            "default_model": "qwen-plus"
-        },
-        "kimi": {
-            "name": "Kimi",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://api.moonshot.cn/v1/chat/completions",
-            "default_model": "moonshot-v1-8k"
-        },
-        "zhipu": {
-            "name": "智谱AI",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://open.bigmodel.cn/api/paas/v4/chat/completions",
-            "default_model": "glm-4-flash"
-        },
-        "doubao": {
-            "name": "豆包API",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://ark.cn-beijing.volces.com/api/v3/chat/completions",
-            "default_model": "doubao-pro-32k"
-        },
-        "hunyuan": {
-            "name": "混元API",
-            "class": OpenAICompatibleClient,
-            "default_url": "https://api.hunyuan.cloud.tencent.com/v1/chat/completions",
-            "default_model": "hunyuan-lite"
-        },
-        "local": {
-            "name": "本地API",
-            "class": LocalAPIClient,
-            "default_url": "http://127.0.0.1:1234/v1/chat/completions",
-            "default_model": "local-model"
-        }
-    }
+    # 预定义的API提供商配置（只读）
+    PROVIDERS = MappingProxyType({
+        "siliconflow": Provider("硅基流动", SiliconFlowClient,
+                        "https://api.siliconflow.cn/v1/chat/completions",
+                        "deepseek-ai/DeepSeek-V3"),
+        "deepseek": Provider("DeepSeek官网", DeepSeekClient,
+                        "https://api.deepseek.com/v1/chat/completions",
+                        "deepseek-chat"),
+        "openai": Provider("OpenAI", OpenAICompatibleClient,
+                        "https://api.openai.com/v1/chat/completions",
+                        "gpt-4o-mini"),
+        "qwen": Provider("通义千问", OpenAICompatibleClient,
+                        "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
+                        "qwen-plus"),
+        "kimi": Provider("Kimi", OpenAICompatibleClient,
+                        "https://api.moonshot.cn/v1/chat/completions",
+                        "moonshot-v1-8k"),
+        "zhipu": Provider("智谱AI", OpenAICompatibleClient,
+                        "https://open.bigmodel.cn/api/paas/v4/chat/completions",
+                        "glm-4-flash"),
+        "doubao": Provider("豆包API", OpenAICompatibleClient,
+                        "https://ark.cn-beijing.volces.com/api/v3/chat/completions",
+                        "doubao-pro-32k"),
+        "hunyuan": Provider("混元API", OpenAICompatibleClient,
+                        "https://api.hunyuan.cloud.tencent.com/v1/chat/completions",
+                        "hunyuan-lite"),
+        "local": Provider("本地API", LocalAPIClient,
+                        "http://127.0.0.1:1234/v1/chat/completions",
+                        "local-model")
+    })
     
     @classmethod
     def create_client(cls, provider: str, api_key: str, base_url: str = None, model: str = None, temperature: float = 0.3, timeout: int = 120) -> APIClient:
@@ -254,17 +179,17 @@ class APIClientFactory:
             raise ValueError(f"不支持的API提供商: {provider}")
         
         provider_config = cls.PROVIDERS[provider]
-        client_class = provider_config["class"]
+        client_class = provider_config.cls
         
         # 使用默认值如果没有提供
         if not base_url:
-            base_url = provider_config["default_url"]
+            base_url = provider_config.default_url
         if not model:
-            model = provider_config["default_model"]
+            model = provider_config.default_model
         
         # 如果是OpenAICompatibleClient，需要传递name参数
-        if client_class == OpenAICompatibleClient:
-            return client_class(api_key, base_url, model, temperature, provider_config["name"], timeout)
+        if client_class is OpenAICompatibleClient:
+            return client_class(api_key, base_url, model, temperature, provider_config.name, timeout)
         else:
             return client_class(api_key, base_url, model, temperature, timeout)
     
@@ -279,9 +204,9 @@ class APIClientFactory:
         if provider not in cls.PROVIDERS:
             raise ValueError(f"不支持的API提供商: {provider}")
         
-        config = cls.PROVIDERS[provider]
+        provider_config = cls.PROVIDERS[provider]
         return {
-            "name": config["name"],
-            "default_url": config["default_url"],
-            "default_model": config["default_model"]
+            "name": provider_config.name,
+            "default_url": provider_config.default_url,
+            "default_model": provider_config.default_model
         }
\ No newline at end of file
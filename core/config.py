@@ -1,10 +1,89 @@
 # core/config.py
-from typing import Dict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping
+import atexit
+import functools
+import json
+import os
 import sys
+import time
 from pathlib import Path
 from core.signal_bus import signal_bus
 from version import VERSION
 
+try:
+    from PySide6.QtCore import QCoreApplication, QSettings, QTimer
+except ImportError:  # 没有Qt时退化为纯文件配置
+    QCoreApplication = QSettings = QTimer = None
+
+# QSettings 缓存中“尚未读取”的占位符
+_MISSING = object()
+
+# 两次写入配置之间的最小间隔（秒）
+_FLUSH_INTERVAL = 1.0
+
+# 支持的API提供商
+_PROVIDERS = ("siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local")
+_PROVIDER_SET = frozenset(_PROVIDERS)
+
+# 所有API提供商的默认配置（只读）
+_DEFAULT_CONFIGS = MappingProxyType({
+    "siliconflow": {
+        "url": "https://api.siliconflow.cn/v1/chat/completions",
+        "model": "deepseek-ai/DeepSeek-V3"
+    },
+    "deepseek": {
+        "url": "https://api.deepseek.com/v1/chat/completions",
+        "model": "deepseek-chat"
+    },
+    "openai": {
+        "url": "https://api.openai.com/v1/chat/completions",
+        "model": "gpt-4o-mini"
+    },
+    "qwen": {
+        "url": "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
+        "model": "qwen-plus"
+    },
+    "kimi": {
+        "url": "https://api.moonshot.cn/v1/chat/completions",
+        "model": "moonshot-v1-8k"
+    },
+    "zhipu": {
+        "url": "https://open.bigmodel.cn/api/paas/v4/chat/completions",
+        "model": "glm-4-flash"
+    },
+    "doubao": {
+        "url": "https://ark.cn-beijing.volces.com/api/v3/chat/completions",
+        "model": "doubao-pro-32k"
+    },
+    "hunyuan": {
+        "url": "https://api.hunyuan.cloud.tencent.com/v1/chat/completions",
+        "model": "hunyuan-lite"
+    },
+    "local": {
+        "url": "http://127.0.0.1:1234/v1/chat/completions",
+        "model": "local-model"
+    }
+})
+
+
+@dataclass
+class ProviderCfg:
+    """单个API提供商的配置"""
+    __slots__ = ("key", "url", "model")
+    key: str
+    url: str
+    model: str
+
+
+@functools.lru_cache(maxsize=1)
+def _config_file_path():
+    """打包环境下的用户配置文件路径（目录只在首次调用时创建）"""
+    path = Path.home() / "Documents" / "StardewTranslator" / "config.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
 
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径，支持开发环境和打包后的环境"""
@@ -32,59 +111,16 @@ class Config:
         
         # 默认配置
         self.api_provider = "siliconflow"  # 默认使用硅基流动
-        self.api_keys = {}  # 存储多个API提供商的密钥
-        self.api_urls = {}  # 存储多个API提供商的URL
-        self.api_models = {}  # 存储多个API提供商的模型
-        
-        # 硅基流动默认配置
-        self.api_keys["siliconflow"] = ""
-        self.api_urls["siliconflow"] = "https://api.siliconflow.cn/v1/chat/completions"
-        self.api_models["siliconflow"] = "deepseek-ai/DeepSeek-V3"
-        
-        # DeepSeek官网默认配置
-        self.api_keys["deepseek"] = ""
-        self.api_urls["deepseek"] = "https://api.deepseek.com/v1/chat/completions"
-        self.api_models["deepseek"] = "deepseek-chat"
-        
-        # OpenAI默认配置
-        self.api_keys["openai"] = ""
-        self.api_urls["openai"] = "https://api.openai.com/v1/chat/completions"
-        self.api_models["openai"] = "gpt-4o-mini"
-        
-        # 通义千问默认配置
-        self.api_keys["qwen"] = ""
-        self.api_urls["qwen"] = "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions"
-        self.api_models["qwen"] = "qwen-plus"
-        
-        # Kimi默认配置
-        self.api_keys["kimi"] = ""
-        self.api_urls["kimi"] = "https://api.moonshot.cn/v1/chat/completions"
-        self.api_models["kimi"] = "moonshot-v1-8k"
-        
-        # 智谱AI默认配置
-        self.api_keys["zhipu"] = ""
-        self.api_urls["zhipu"] = "https://open.bigmodel.cn/api/paas/v4/chat/completions"
-        self.api_models["zhipu"] = "glm-4-flash"
-        
-        # 豆包API默认配置
-        self.api_keys["doubao"] = ""
-        self.api_urls["doubao"] = "https://ark.cn-beijing.volces.com/api/v3/chat/completions"
-        self.api_models["doubao"] = "doubao-pro-32k"
-        
-        # 混元API默认配置
-        self.api_keys["hunyuan"] = ""
-        self.api_urls["hunyuan"] = "https://api.hunyuan.cloud.tencent.com/v1/chat/completions"
-        self.api_models["hunyuan"] = "hunyuan-lite"
-        
-        # 本地API默认配置
-        self.api_keys["local"] = ""
-        self.api_urls["local"] = "http://127.0.0.1:1234/v1/chat/completions"
-        self.api_models["local"] = "local-model"
+        # 各API提供商的密钥、URL和模型
+        self.providers: Dict[str, ProviderCfg] = {
+            provider: ProviderCfg("", cfg["url"], cfg["model"])
+            for provider, cfg in _DEFAULT_CONFIGS.items()
+        }
         
         # 兼容旧配置
         self.api_key = ""
-        self.api_url = self.api_urls[self.api_provider]
-        self.default_model = self.api_models[self.api_provider]
+        self.api_url = self.providers[self.api_provider].url
+        self.default_model = self.providers[self.api_provider].model
         
         # 其他配置
         self.default_batch_size = 20
@@ -95,6 +131,19 @@ class Config:
         self.use_background = True
         self.custom_background_light = ""
         self.custom_background_dark = ""
+        self.log_level = "DEBUG"  # 设为 "INFO" 时不再输出调试日志
+
+        # QSettings 实例（首次使用时创建，之后复用）
+        self._qsettings = None
+        # QSettings 键值缓存：读取时填充，写入时只在值变化时落盘
+        self._settings_cache = {}
+        self._settings_preloaded = False
+        # 脏标记：批量修改后合并为一次写入
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_scheduled = False
+        # get_current_api_config 的缓存
+        self._current_cfg_cache = None
 
         # 加载保存的配置
         self.load_from_settings()
@@ -102,62 +151,121 @@ class Config:
         # 确保所有API提供商都有默认配置
         self._ensure_default_configs()
 
+        # 退出时写入尚未保存的修改
+        atexit.register(self.flush, True)
+
+    def _settings(self):
+        """获取复用的QSettings实例"""
+        if self._qsettings is None:
+            if QSettings is None:
+                raise RuntimeError("QSettings 不可用")
+            self._qsettings = QSettings("StardewTranslator", "StardewTranslator")
+        return self._qsettings
+
+    def get_provider_config(self, provider: str) -> ProviderCfg:
+        """获取指定提供商的配置（未知提供商返回空配置）"""
+        return self.providers.get(provider) or ProviderCfg("", "", "")
+
+    def _provider_cfg(self, provider: str) -> ProviderCfg:
+        """获取指定提供商的配置，不存在时创建"""
+        cfg = self.providers.get(provider)
+        if cfg is None:
+            cfg = self.providers[provider] = ProviderCfg("", "", "")
+        return cfg
+
+    def _update_compat_attrs(self):
+        """更新兼容旧代码的 api_key / api_url / default_model 属性"""
+        cfg = self.get_provider_config(self.api_provider)
+        self.api_key = cfg.key
+        self.api_url = cfg.url
+        self.default_model = cfg.model
+
+    def _get(self, key, default=None, value_type=None):
+        """读取配置项，优先使用缓存"""
+        value = self._settings_cache.get(key, _MISSING)
+        if value is _MISSING:
+            # 根级配置已整体读取过时，缓存中没有的键就是未保存过的键
+            value = None if self._settings_preloaded and '/' not in key else self._settings().value(key)
+            self._settings_cache[key] = value
+        if value is None:
+            return default
+        if value_type is bool and isinstance(value, str):
+            # INI/注册表后端会把布尔值存成字符串
+            return value.lower() in ("true", "1")
+        return value
+
+    def _set(self, key, value):
+        """写入配置项，值未变化时跳过"""
+        if self._settings_cache.get(key, _MISSING) != value:
+            self._settings().setValue(key, value)
+            self._settings_cache[key] = value
+
+    def _preload_settings(self):
+        """用一次 childKeys() 遍历读取根级所有配置项写入缓存，之后未保存过的键直接视为缺失"""
+        settings = self._settings()
+        for key in settings.childKeys():
+            self._settings_cache[key] = settings.value(key)
+        self._settings_preloaded = True
+
     def load_from_settings(self):
         """从QSettings加载配置"""
+        self._current_cfg_cache = None
         try:
-            from PySide6.QtCore import QSettings
-            settings = QSettings("StardewTranslator", "StardewTranslator")
-
             # 加载API提供商配置
-            self.api_provider = settings.value("api_provider", self.api_provider)
+            self.api_provider = self._get("api_provider", self.api_provider)
             
-            # 加载各API提供商的密钥
-            for provider in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
-                key = settings.value(f"api_key_{provider}", "")
-                url = settings.value(f"api_url_{provider}", self.api_urls.get(provider))  # 使用默认值
-                model = settings.value(f"api_model_{provider}", self.api_models.get(provider))  # 使用默认值
+            # 加载各API提供商的密钥（根级配置整体读取一次）
+            self._preload_settings()
+            saved_urls = {}  # 已保存的新格式URL，供下面的旧配置迁移判断复用
+            saved_models = {}
+            for provider in _PROVIDERS:
+                key = self._get(f"api_key_{provider}", "")
+                saved_urls[provider] = self._get(f"api_url_{provider}")
+                saved_models[provider] = self._get(f"api_model_{provider}")
                 
+                cfg = self.providers[provider]
                 if key:
-                    self.api_keys[provider] = key
+                    cfg.key = key
                 # 总是更新URL和模型，确保使用默认值或保存的值
-                self.api_urls[provider] = url
-                self.api_models[provider] = model
+                if saved_urls[provider] is not None:
+                    cfg.url = saved_urls[provider]
+                if saved_models[provider] is not None:
+                    cfg.model = saved_models[provider]
             
             # 兼容旧配置
-            old_key = settings.value("api_key", "")
-            if old_key and not self.api_keys.get(self.api_provider):
-                self.api_keys[self.api_provider] = old_key
+            old_key = self._get("api_key", "")
+            if old_key and not self.get_provider_config(self.api_provider).key:
+                self._provider_cfg(self.api_provider).key = old_key
             
             # 只有在没有保存过新格式的URL时才使用旧格式的URL
-            old_url = settings.value("api_url", "")
-            if old_url and not settings.value(f"api_url_{self.api_provider}", None):
-                self.api_urls[self.api_provider] = old_url
+            old_url = self._get("api_url", "")
+            if old_url and not saved_urls.get(self.api_provider):
+                self._provider_cfg(self.api_provider).url = old_url
             
             # 只有在没有保存过新格式的模型时才使用旧格式的模型
-            old_model = settings.value("model", "")
-            if old_model and not settings.value(f"api_model_{self.api_provider}", None):
-                self.api_models[self.api_provider] = old_model
+            old_model = self._get("model", "")
+            if old_model and not saved_models.get(self.api_provider):
+                self._provider_cfg(self.api_provider).model = old_model
             
             # 更新兼容属性
-            self.api_key = self.api_keys.get(self.api_provider, "")
-            self.api_url = self.api_urls.get(self.api_provider, "")
-            self.default_model = self.api_models.get(self.api_provider, "")
+            self._update_compat_attrs()
             
             # 加载版本相关配置
-            self.github_owner = settings.value("github_owner", self.github_owner)
-            self.github_repo = settings.value("github_repo", self.github_repo)
-            self.update_download_url = settings.value("update_download_url", self.update_download_url)
-            self.update_download_password = settings.value("update_download_password", self.update_download_password)
+            self.github_owner = self._get("github_owner", self.github_owner)
+            self.github_repo = self._get("github_repo", self.github_repo)
+            self.update_download_url = self._get("update_download_url", self.update_download_url)
+            self.update_download_password = self._get("update_download_password", self.update_download_password)
             
             # 加载其他配置
-            self.default_batch_size = int(settings.value("batch_size", self.default_batch_size))
-            self.max_retries = int(settings.value("max_retries", self.max_retries))
-            self.api_timeout = int(settings.value("api_timeout", self.api_timeout))
-            self.temperature = float(settings.value("temperature", self.temperature))
-            self.theme = settings.value("theme", self.theme)
-            self.use_background = settings.value("use_background", self.use_background, type=bool)
-            self.custom_background_light = settings.value("custom_background_light", self.custom_background_light)
-            self.custom_background_dark = settings.value("custom_background_dark", self.custom_background_dark)
+            self.default_batch_size = int(self._get("batch_size", self.default_batch_size))
+            self.max_retries = int(self._get("max_retries", self.max_retries))
+            self.api_timeout = int(self._get("api_timeout", self.api_timeout))
+            self.temperature = float(self._get("temperature", self.temperature))
+            self.theme = self._get("theme", self.theme)
+            self.use_background = self._get("use_background", self.use_background, bool)
+            self.custom_background_light = self._get("custom_background_light", self.custom_background_light)
+            self.custom_background_dark = self._get("custom_background_dark", self.custom_background_dark)
+            self.log_level = self._get("log_level", self.log_level)
             
         except Exception:
             # 如果QSettings不可用，使用默认值
@@ -166,8 +274,7 @@ class Config:
         # 检查是否在打包环境中运行
         if getattr(sys, 'frozen', False):
             # 尝试从文件加载配置（如果存在）
-            from pathlib import Path
-            config_file = Path.home() / "Documents" / "StardewTranslator" / "config.json"
+            config_file = _config_file_path()
             if config_file.exists():
                 self._load_from_file(config_file)
             else:
@@ -178,23 +285,21 @@ class Config:
     def save_to_settings(self):
         """保存配置到QSettings"""
         try:
-            from PySide6.QtCore import QSettings
-            settings = QSettings("StardewTranslator", "StardewTranslator")
-            
             # 保存API提供商配置
-            settings.setValue("api_provider", self.api_provider)
+            self._set("api_provider", self.api_provider)
             
             # 保存各API提供商的配置
-            for provider in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
-                settings.setValue(f"api_key_{provider}", self.api_keys.get(provider, ""))
-                settings.setValue(f"api_url_{provider}", self.api_urls.get(provider, ""))
-                settings.setValue(f"api_model_{provider}", self.api_models.get(provider, ""))
+            for provider in _PROVIDERS:
+                cfg = self.providers[provider]
+                self._set(f"api_key_{provider}", cfg.key)
+                self._set(f"api_url_{provider}", cfg.url)
+                self._set(f"api_model_{provider}", cfg.model)
             
             # 保存版本相关配置
-            settings.setValue("github_owner", self.github_owner)
-            settings.setValue("github_repo", self.github_repo)
-            settings.setValue("update_download_url", self.update_download_url)
-            settings.setValue("update_download_password", self.update_download_password)
+            self._set("github_owner", self.github_owner)
+            self._set("github_repo", self.github_repo)
+            self._set("update_download_url", self.update_download_url)
+            self._set("update_download_password", self.update_download_password)
             
             # 检查是否在打包环境中运行
             if getattr(sys, 'frozen', False):
@@ -202,14 +307,19 @@ class Config:
                 self._save_to_file()
             
             # 保存其他配置
-            settings.setValue("batch_size", self.default_batch_size)
-            settings.setValue("max_retries", self.max_retries)
-            settings.setValue("api_timeout", self.api_timeout)
-            settings.setValue("temperature", self.temperature)
-            settings.setValue("theme", self.theme)
-            settings.setValue("use_background", self.use_background)
-            settings.setValue("custom_background_light", self.custom_background_light)
-            settings.setValue("custom_background_dark", self.custom_background_dark)
+            self._set("batch_size", self.default_batch_size)
+            self._set("max_retries", self.max_retries)
+            self._set("api_timeout", self.api_timeout)
+            self._set("temperature", self.temperature)
+            self._set("theme", self.theme)
+            self._set("use_background", self.use_background)
+            self._set("custom_background_light", self.custom_background_light)
+            self._set("custom_background_dark", self.custom_background_dark)
+            self._set("log_level", self.log_level)
+            self._settings().sync()
+            
+            self._dirty = False
+            self._last_flush = time.monotonic()
             
         except Exception:
             # 如果QSettings不可用，忽略保存
@@ -218,20 +328,13 @@ class Config:
     def _save_to_file(self):
         """保存配置到文件"""
         try:
-            import json
-            from pathlib import Path
-            
-            # 创建配置目录
-            config_dir = Path.home() / "Documents" / "StardewTranslator"
-            config_dir.mkdir(parents=True, exist_ok=True)
-            
-            config_file = config_dir / "config.json"
+            config_file = _config_file_path()
             
             config_data = {
                 "api_provider": self.api_provider,
-                "api_keys": self.api_keys,
-                "api_urls": self.api_urls,
-                "api_models": self.api_models,
+                "api_keys": {name: cfg.key for name, cfg in self.providers.items()},
+                "api_urls": {name: cfg.url for name, cfg in self.providers.items()},
+                "api_models": {name: cfg.model for name, cfg in self.providers.items()},
                 "api_key": self.api_key,  # 兼容旧配置
                 "api_url": self.api_url,  # 兼容旧配置
                 "default_model": self.default_model,  # 兼容旧配置
@@ -242,23 +345,25 @@ class Config:
                 "theme": self.theme,
                 "use_background": self.use_background,
                 "custom_background_light": self.custom_background_light,
-                "custom_background_dark": self.custom_background_dark
+                "custom_background_dark": self.custom_background_dark,
+                "log_level": self.log_level
             }
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            # 先一次性写入临时文件再原子替换，避免写到一半崩溃导致配置文件损坏
+            data = json.dumps(config_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            tmp_file = config_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, config_file)
                 
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"保存配置文件失败: {e}", {})
     
     def _load_from_file(self, config_file=None):
         """从文件加载配置"""
+        self._current_cfg_cache = None
         try:
-            import json
-            from pathlib import Path
-            
             if config_file is None:
-                config_file = Path.home() / "Documents" / "StardewTranslator" / "config.json"
+                config_file = _config_file_path()
             
             if not config_file.exists():
                 return
@@ -268,26 +373,17 @@ class Config:
                 
             self.api_provider = config_data.get("api_provider", "siliconflow")
             
-            # 加载API密钥
+            # 加载API密钥、URL和模型（文件中没有的URL和模型保持初始化时的默认值）
             loaded_keys = config_data.get("api_keys", {})
-            for provider in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
-                self.api_keys[provider] = loaded_keys.get(provider, "")
-            
-            # 加载API URL，确保使用默认值
             loaded_urls = config_data.get("api_urls", {})
-            for provider in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
-                # 如果文件中没有这个provider的URL，使用初始化时的默认值
-                if provider in loaded_urls:
-                    self.api_urls[provider] = loaded_urls[provider]
-                # 保持初始化时设置的默认值
-            
-            # 加载API模型，确保使用默认值
             loaded_models = config_data.get("api_models", {})
-            for provider in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
-                # 如果文件中没有这个provider的模型，使用初始化时的默认值
+            for provider in _PROVIDERS:
+                cfg = self.providers[provider]
+                cfg.key = loaded_keys.get(provider, "")
+                if provider in loaded_urls:
+                    cfg.url = loaded_urls[provider]
                 if provider in loaded_models:
-                    self.api_models[provider] = loaded_models[provider]
-                # 保持初始化时设置的默认值
+                    cfg.model = loaded_models[provider]
             
             # 兼容旧配置
             self.api_key = config_data.get("api_key", "")
@@ -302,97 +398,85 @@ class Config:
             self.use_background = config_data.get("use_background", True)
             self.custom_background_light = config_data.get("custom_background_light", "")
             self.custom_background_dark = config_data.get("custom_background_dark", "")
+            self.log_level = config_data.get("log_level", "DEBUG")
             
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"加载配置文件失败: {e}", {})
     
-    def get_current_api_config(self) -> Dict:
-        """获取当前API提供商的配置"""
-        return {
-            "provider": self.api_provider,
-            "api_key": self.api_keys.get(self.api_provider, ""),
-            "api_url": self.api_urls.get(self.api_provider, ""),
-            "model": self.api_models.get(self.api_provider, "")
-        }
+    def get_current_api_config(self) -> Mapping:
+        """获取当前API提供商的配置（只读，配置变化时自动失效）"""
+        if self._current_cfg_cache is None:
+            cfg = self.get_provider_config(self.api_provider)
+            self._current_cfg_cache = MappingProxyType({
+                "provider": self.api_provider,
+                "api_key": cfg.key,
+                "api_url": cfg.url,
+                "model": cfg.model
+            })
+        return self._current_cfg_cache
     
     def set_current_api_config(self, provider: str, api_key: str, api_url: str = None, model: str = None):
         """设置当前API提供商的配置"""
-        if provider not in ["siliconflow", "deepseek", "openai", "qwen", "kimi", "zhipu", "doubao", "hunyuan", "local"]:
+        if provider not in _PROVIDER_SET:
             raise ValueError(f"不支持的API提供商: {provider}")
         
+        self._current_cfg_cache = None
         self.api_provider = provider
-        self.api_keys[provider] = api_key
+        cfg = self.providers[provider]
+        cfg.key = api_key
         
         if api_url is not None:
-            self.api_urls[provider] = api_url
+            cfg.url = api_url
         if model is not None:
-            self.api_models[provider] = model
+            cfg.model = model
         
         # 更新兼容属性
-        self.api_key = api_key
-        self.api_url = self.api_urls[provider]
-        self.default_model = self.api_models[provider]
+        self._update_compat_attrs()
         
-        # 保存配置
-        self.save_to_settings()
+        # 标记待保存，稍后统一写入
+        self.mark_dirty()
 
-    
+    def mark_dirty(self):
+        """标记配置已修改，并安排一次延迟写入"""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """在Qt事件循环中安排延迟写入（没有Qt应用时由退出钩子负责）"""
+        if self._flush_scheduled:
+            return
+        if QCoreApplication is None or QCoreApplication.instance() is None:
+            return
+        self._flush_scheduled = True
+        QTimer.singleShot(int(_FLUSH_INTERVAL * 1000), self._on_flush_timer)
+
+    def _on_flush_timer(self):
+        self._flush_scheduled = False
+        self.flush(True)
+
+    def flush(self, force=False):
+        """写入尚未保存的修改"""
+        if not self._dirty:
+            return
+        if not force and time.monotonic() - self._last_flush < _FLUSH_INTERVAL:
+            self._schedule_flush()
+            return
+        self.save_to_settings()
 
     def _ensure_default_configs(self):
         """确保所有API提供商都有默认配置"""
-        # 定义所有API提供商的默认配置
-        default_configs = {
-            "siliconflow": {
-                "url": "https://api.siliconflow.cn/v1/chat/completions",
-                "model": "deepseek-ai/DeepSeek-V3"
-            },
-            "deepseek": {
-                "url": "https://api.deepseek.com/v1/chat/completions",
-                "model": "deepseek-chat"
-            },
-            "openai": {
-                "url": "https://api.openai.com/v1/chat/completions",
-                "model": "gpt-4o-mini"
-            },
-            "qwen": {
-                "url": "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
-                "model": "qwen-plus"
-            },
-            "kimi": {
-                "url": "https://api.moonshot.cn/v1/chat/completions",
-                "model": "moonshot-v1-8k"
-            },
-            "zhipu": {
-                "url": "https://open.bigmodel.cn/api/paas/v4/chat/completions",
-                "model": "glm-4-flash"
-            },
-            "doubao": {
-                "url": "https://ark.cn-beijing.volces.com/api/v3/chat/completions",
-                "model": "doubao-pro-32k"
-            },
-            "hunyuan": {
-                "url": "https://api.hunyuan.cloud.tencent.com/v1/chat/completions",
-                "model": "hunyuan-lite"
-            },
-            "local": {
-                "url": "http://127.0.0.1:1234/v1/chat/completions",
-                "model": "local-model"
-            }
-        }
+        self._current_cfg_cache = None
         
         # 确保每个提供商都有URL和模型
-        for provider, config in default_configs.items():
-            if provider not in self.api_urls or not self.api_urls[provider]:
-                self.api_urls[provider] = config["url"]
-            if provider not in self.api_models or not self.api_models[provider]:
-                self.api_models[provider] = config["model"]
-            if provider not in self.api_keys:
-                self.api_keys[provider] = ""
+        for provider, config in _DEFAULT_CONFIGS.items():
+            cfg = self._provider_cfg(provider)
+            if not cfg.url:
+                cfg.url = config["url"]
+            if not cfg.model:
+                cfg.model = config["model"]
         
         # 更新兼容属性
-        self.api_key = self.api_keys.get(self.api_provider, "")
-        self.api_url = self.api_urls.get(self.api_provider, "")
-        self.default_model = self.api_models.get(self.api_provider, "")
+        self._update_compat_attrs()
 
     def get(self, key, default=None):
         """获取配置值（兼容字典接口）"""
@@ -403,7 +487,8 @@ class Config:
         for key, value in settings_dict.items():
             if hasattr(self, key):
                 setattr(self, key, value)
-        self.save_to_settings()
+        self._current_cfg_cache = None
+        self.mark_dirty()
 
 # 全局配置实例
 config = Config()
\ No newline at end of file
@@ -1,15 +1,77 @@
 # core/file_tool.py
+import bisect
+import io
 import json
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List
 
 import hjson
 from PySide6.QtCore import QObject
 
 from core.signal_bus import signal_bus
 
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库
+    orjson = None
+
+# 清理控制字符用的转换表：制表符替换为两个空格，保留换行符，删除其他控制字符
+_CTRL_TRANSLATE = dict.fromkeys([*range(0, 9), 11, 12, 13, *range(14, 32), 0x7F])
+_CTRL_TRANSLATE[ord('\t')] = '  '
+_UTF8_BOM = b'\xef\xbb\xbf'
+# 不超过该大小的文件直接整体读入，更大的文件用内存映射
+_SMALL_FILE_SIZE = 1024 * 1024
+
+# 快速路径使用的 C 解析器
+_fast_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_indented(data) -> str:
+    """两空格缩进序列化，格式与 json.dumps(ensure_ascii=False, indent=2) 相同；orjson 不支持的数据回退标准库"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+# 宽松 JSON 预处理：跳过字符串，删除 // 和 /* */ 注释以及 } ] 前的尾随逗号
+_RELAXED_JSON_RE = re.compile(
+    r'("(?:[^"\\\n]|\\.)*")'
+    r'|//[^\n]*'
+    r'|/\*.*?\*/'
+    r'|,(?=(?:\s|//[^\n]*|/\*.*?\*/)*[}\]])',
+    re.DOTALL
+)
+
+# 同一行内 } ] 前的尾随逗号
+_INLINE_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# 键值对的值部分：双引号或单引号字符串，支持多行和转义字符
+_DQ_VALUE = r'"(?:[^"\\]|\\.)*"'
+_SQ_VALUE = r"'(?:[^'\\]|\\.)*'"
+
+
+def _compile_keys_regex(keys: List[str]) -> re.Pattern:
+    """把所有键编译成一个交替正则，一次扫描即可找到全部键值对"""
+    # 长键在前，避免被前缀相同的短键抢先匹配
+    alt = '|'.join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+    return re.compile(
+        # 双引号键 + 双引号值
+        rf'"(?P<dq>{alt})"\s*:\s*{_DQ_VALUE}'
+        # 单引号键 + 单引号值
+        rf"|'(?P<sq>{alt})'\s*:\s*{_SQ_VALUE}"
+        # 无引号键 + 双引号值
+        rf'|(?P<bare>{alt})\s*:\s*{_DQ_VALUE}',
+        re.DOTALL
+    )
+
 
 class FileTool(QObject):
 
@@ -21,75 +83,50 @@ class FileTool(QObject):
     @staticmethod
     def read_json_file(file_path: str):
         """读取JSON文件，自动处理注释，尾随逗号，BOM格式问题"""
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
+        if orjson is not None:
+            # 标准 JSON 直接从 UTF-8 字节解析，不先解码成 str；失败再走宽松解析
+            with open(file_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if 0 < size <= _SMALL_FILE_SIZE:
+                    # 小文件（大多数 i18n 文件）一次无缓冲读入，比建立内存映射更省；宽松解析也复用这份内容
+                    raw = f.read()
+                    body = memoryview(raw)[len(_UTF8_BOM):] if raw.startswith(_UTF8_BOM) else raw
+                    try:
+                        return orjson.loads(body)
+                    except orjson.JSONDecodeError:
+                        return FileTool._parse_json_text(str(body, 'utf-8'), file_path)
+                if size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        offset = len(_UTF8_BOM) if mm[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+                        with memoryview(mm) as view, view[offset:] as body:
+                            try:
+                                return orjson.loads(body)
+                            except orjson.JSONDecodeError:
+                                pass
+        return FileTool._parse_json_text(FileTool._read_text(file_path), file_path)
+
+    @staticmethod
+    def _parse_json_text(content: str, file_path: str):
+        """解析已读入内存的JSON文本（file_path 仅用于日志）"""
+        # 绝大多数文件是标准 JSON（最多带注释和尾随逗号），先走 C 解析器
+        try:
+            return _fast_json_loads(content)
+        except ValueError:
+            pass
+        try:
+            return _fast_json_loads(_RELAXED_JSON_RE.sub(lambda m: m.group(1) or '', content))
+        except ValueError:
+            pass
         
         try:
-            # 首先尝试直接用 hjson 解析
+            # 快速路径失败时再用 hjson 解析
             return hjson.loads(content)
         except Exception as e:
             # 如果解析失败，尝试清理文件内容
             signal_bus.log_message.emit("WARNING", f"hjson 解析失败，尝试清理文件内容: {file_path}", {'错误': str(e)})
             
-            # 更彻底的清理内容
-            cleaned_content = content
-            
-            # 替换各种控制字符
-            cleaned_content = cleaned_content.replace('\t', '  ')  # 制表符
-            cleaned_content = cleaned_content.replace('\r', '')  # 回车符
-            cleaned_content = cleaned_content.replace('\f', '')  # 换页符
-            cleaned_content = cleaned_content.replace('\v', '')  # 垂直制表符
-            
-            # 移除字符串值中的控制字符（保留在字符串外的）
-            import re
-            # 匹配 JSON 字符串值并清理其中的控制字符
-            def clean_string_value(match):
-                quote = match.group(1)  # 引号类型
-                content = match.group(2)  # 字符串内容
-                # 清理字符串内容中的控制字符，但保留转义序列
-                cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content)
-                return f'{quote}{cleaned}{quote}'
-            
-            # 不使用正则表达式，直接逐字符清理控制字符
-            # 这种方法更安全，不会误匹配
-            def clean_text_preserving_structure(text):
-                result = []
-                in_string = False
-                string_quote = None
-                i = 0
-                
-                while i < len(text):
-                    char = text[i]
-                    
-                    # 检查是否进入或退出字符串
-                    if not in_string and char in ['"', "'"]:
-                        in_string = True
-                        string_quote = char
-                        result.append(char)
-                    elif in_string and char == string_quote:
-                        # 检查是否是转义的引号
-                        if i > 0 and text[i-1] == '\\':
-                            result.append(char)
-                        else:
-                            in_string = False
-                            string_quote = None
-                            result.append(char)
-                    elif in_string:
-                        # 在字符串内，清理控制字符
-                        if ord(char) < 32 and char not in ['\n', '\r']:  # 保留换行符，清理其他控制字符
-                            # 跳过控制字符
-                            pass
-                        else:
-                            result.append(char)
-                    else:
-                        # 在字符串外，保持原样
-                        result.append(char)
-                    
-                    i += 1
-                
-                return ''.join(result)
-            
-            cleaned_content = clean_text_preserving_structure(cleaned_content)
+            # 更彻底的清理内容：制表符换成空格，删除换行符以外的控制字符
+            cleaned_content = content.translate(_CTRL_TRANSLATE)
             
             try:
                 # 再次尝试解析
@@ -98,91 +135,73 @@ class FileTool(QObject):
                 # 如果还是失败，尝试用标准 json 解析（忽略注释）
                 signal_bus.log_message.emit("WARNING", f"清理后仍然解析失败，尝试标准 json 解析: {file_path}", {'错误': str(e2)})
                 try:
-                    # 移除注释行
-                    lines = []
+                    # 移除注释行，同时在同一次遍历中处理尾随逗号
+                    buf = io.StringIO()
+                    trailing_comma = -1  # 上一行末尾逗号在缓冲区中的位置
                     for line in cleaned_content.split('\n'):
-                        # 移除行内注释
-                        if '//' in line:
-                            line = line[:line.index('//')]
+                        # 移除行内注释（忽略字符串中的 //）
+                        line = FileTool._strip_line_comment(line).rstrip()
                         # 跳过空行和纯注释行
-                        if line.strip():
-                            lines.append(line)
+                        if not line.strip():
+                            continue
+                        # 本行以 } 或 ] 开头时删除上一行末尾的逗号
+                        if trailing_comma >= 0 and line.lstrip()[0] in '}]':
+                            buf.seek(trailing_comma)
+                            buf.truncate()
+                        if ',' in line and ('}' in line or ']' in line):
+                            line = _INLINE_TRAILING_COMMA_RE.sub(r'\1', line)
+                        if buf.tell():
+                            buf.write('\n')
+                        buf.write(line)
+                        trailing_comma = buf.tell() - 1 if line.endswith(',') else -1
                     
-                    cleaned_json = '\n'.join(lines)
-                    # 处理尾随逗号
-                    cleaned_json = re.sub(r',(\s*[}\]])', r'\1', cleaned_json)
-                    
-                    return json.loads(cleaned_json)
+                    return json.loads(buf.getvalue())
                 except Exception as e3:
                     try:
                         signal_bus.log_message.emit("WARNING", f"尝试手动解析文件: {file_path}", {})
-                        # 创建一个更智能的解析器
+                        # 创建一个更智能的解析器：在整段文本上按下标扫描，多行字符串一次切片
                         result = {}
-                        lines = cleaned_content.split('\n')
-                        i = 0
-                        while i < len(lines):
-                            line = lines[i].strip()
+                        content_length = len(cleaned_content)
+                        line_start = 0
+                        while line_start < content_length:
+                            line_end = cleaned_content.find('\n', line_start)
+                            if line_end == -1:
+                                line_end = content_length
+                            next_start = line_end + 1
+                            line = cleaned_content[line_start:line_end].strip()
+                            
+                            # 跳过空行、注释行和不含键值对的行
+                            if not line or line.startswith('//') or ':' not in line:
+                                line_start = next_start
+                                continue
+                            
+                            # 分割键和值
+                            colon_pos = cleaned_content.find(':', line_start, line_end)
+                            key = cleaned_content[line_start:colon_pos].strip().strip('\"\'')
+                            value_part = cleaned_content[colon_pos + 1:line_end].strip()
                             
-                            # 跳过空行和注释行
-                            if not line or line.startswith('//'):
-                                i += 1
+                            if not key:
+                                line_start = next_start
                                 continue
                             
-                            # 查找键值对
-                            if ':' in line:
-                                # 分割键和值
-                                parts = line.split(':', 1)
-                                key = parts[0].strip().strip('\"\'')
-                                value_part = parts[1].strip()
-                                
-                                if not key:
-                                    i += 1
-                                    continue
-                                
-                                # 检查值是否以引号开始
-                                if value_part.startswith('"') or value_part.startswith("'"):
-                                    quote = value_part[0]
-                                    value = value_part[1:]  # 移除开始引号
-                                    
-                                    # 检查是否在同一行结束（可能后面有逗号或其他字符）
-                                    # 使用正则表达式找到结束引号的位置
-                                    import re
-                                    match = re.search(rf'(?<!\\){quote}', value)
-                                    if match:
-                                        # 找到未转义的结束引号
-                                        end_pos = match.start()
-                                        value = value[:end_pos]  # 只保留引号之前的内容
-                                    else:
-                                        # 多行字符串，继续读取直到找到未转义的结束引号
-                                        i += 1
-                                        found_end = False
-                                        while i < len(lines):
-                                            next_line = lines[i]
-                                            value += '\n' + next_line
-                                            
-                                            # 检查这一行是否有未转义的结束引号
-                                            pos = 0
-                                            while pos < len(next_line):
-                                                if next_line[pos] == quote:
-                                                    # 检查是否是转义的引号
-                                                    if pos == 0 or next_line[pos-1] != '\\':
-                                                        # 找到未转义的结束引号
-                                                        # 移除这个引号及之后的内容
-                                                        value = value[:value.rfind('\n') + 1 + pos]
-                                                        found_end = True
-                                                        break
-                                                pos += 1
-                                            
-                                            if found_end:
-                                                break
-                                            i += 1
-                                    
-                                    result[key] = value
-                                else:
-                                    # 非字符串值（如数字、布尔值等）
-                                    result[key] = value_part
+                            # 检查值是否以引号开始
+                            if value_part.startswith('"') or value_part.startswith("'"):
+                                quote = value_part[0]
+                                value_start = cleaned_content.find(quote, colon_pos + 1) + 1
+                                # 查找未转义的结束引号（可能跨越多行）
+                                value_end = FileTool._find_closing_quote(cleaned_content, quote, value_start)
+                                if value_end == -1:
+                                    result[key] = cleaned_content[value_start:]
+                                    break
+                                result[key] = cleaned_content[value_start:value_end]
+                                # 从结束引号所在行的下一行继续
+                                end_line = cleaned_content.find('\n', value_end)
+                                next_start = content_length if end_line == -1 else end_line + 1
+                            else:
+                                # 非字符串值（如数字、布尔值等）
+                                result[key] = value_part
                             
-                            i += 1
+                            line_start = next_start
                         
                         signal_bus.log_message.emit("SUCCESS", f"手动解析成功，提取了 {len(result)} 个键值对: {file_path}", {})
                         return result
@@ -190,6 +209,55 @@ class FileTool(QObject):
                         signal_bus.log_message.emit("ERROR", f"手动解析也失败了: {file_path}", {'错误': str(e4)})
                         raise e3
 
+    @staticmethod
+    def _read_text(file_path: str) -> str:
+        """通过 mmap 读取 UTF-8 文本（自动跳过 BOM），直接从映射内存解码，不产生中间 bytes 副本"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offset = len(_UTF8_BOM) if mm[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+                with memoryview(mm) as view, view[offset:] as body:
+                    return str(body, 'utf-8')
+
+    @staticmethod
+    def _strip_line_comment(line: str) -> str:
+        """截断到第一个不在字符串内的 //，字符串中的 //（如 URL）保持不变"""
+        idx = line.find('//')
+        if idx == -1:
+            return line
+        in_string = None
+        escape = False
+        for i in range(len(line)):
+            ch = line[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == in_string:
+                    in_string = None
+            elif ch == '"' or ch == "'":
+                in_string = ch
+            elif ch == '/' and line.startswith('//', i):
+                return line[:i]
+        return line
+
+    @staticmethod
+    def _find_closing_quote(text: str, quote: str, start: int) -> int:
+        """从start开始查找未被转义的引号位置（前面有偶数个反斜杠），找不到返回-1"""
+        pos = text.find(quote, start)
+        while pos != -1:
+            backslashes = 0
+            check = pos - 1
+            while check >= start and text[check] == '\\':
+                backslashes += 1
+                check -= 1
+            if backslashes % 2 == 0:
+                return pos
+            pos = text.find(quote, pos + 1)
+        return -1
+
     def save_json_file(self, translation_data: Dict, target_path: str, original_path: str = None) -> bool:
         """
         安全的翻译合并：完全保留original_path文件的结构、注释和格式
@@ -200,24 +268,16 @@ class FileTool(QObject):
                 with open(original_path, 'r', encoding='utf-8') as f:
                     original_content = f.read()
 
-                # 读取原始文件的JSON数据（用于获取原始值）
-                original_data = self.read_json_file(original_path)
-                additional_content = {}
-                result_content = original_content
-
-                for key, new_value in translation_data.items():
-                    if key not in original_data:
-                        additional_content.update({key: new_value})
-                        continue
+                # 直接解析已读入的内容获取原始值，不再重复读取文件
+                original_data = self._parse_json_text(original_content.lstrip('\ufeff'), original_path)
+                # 只统计未匹配的键数量，用于日志
+                additional_count = sum(1 for key in translation_data if key not in original_data)
 
-                    old_value = original_data[key]
-
-                    # 统一处理方法，同时支持单行和多行
-                    result_content = self._regex_replace(result_content, key, old_value, new_value)
+                # 一次扫描替换所有键，同时支持单行和多行
+                result_content = self._apply_all_replacements(original_content, translation_data, original_data)
 
                 # 写入目标文件
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(result_content)
+                self._write_text(target_path, result_content)
 
                 # 发射成功日志信号
                 signal_bus.log_message.emit(
@@ -228,10 +288,10 @@ class FileTool(QObject):
 
                 # 不再保存额外内容文件
                 # 如果有额外内容，只记录日志但不保存文件
-                if additional_content:
+                if additional_count:
                     signal_bus.log_message.emit(
                         'SUCCESS',
-                        f'发现 {len(additional_content)} 个未匹配到的内容，但不保存到单独文件',
+                        f'发现 {additional_count} 个未匹配到的内容，但不保存到单独文件',
                         {'源文件路径': original_path}
                     )
 
@@ -247,67 +307,104 @@ class FileTool(QObject):
                 )
                 return False
         else:
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(json.dumps(translation_data, ensure_ascii=False, indent=2))
-                return True
+            self._write_text(target_path, _dumps_indented(translation_data))
+            return True
+
+    @staticmethod
+    def _write_text(file_path: str, text: str):
+        """一次编码为 UTF-8 字节后整体写入（换行符与文本模式写入保持一致）"""
+        if os.linesep != '\n':
+            text = text.replace('\n', os.linesep)
+        data = text.encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(data)
 
     @staticmethod
-    def _regex_replace(content: str, key: str, old_value: str, new_value: str) -> str:
+    def _build_comment_mask(text: str) -> bytearray:
+        """生成注释掩码：mask[i] 为 1 表示第 i 个字符所在行在它之前已出现 //"""
+        mask = bytearray(len(text))
+        pos = text.find('//')
+        while pos != -1:
+            line_end = text.find('\n', pos)
+            if line_end == -1:
+                line_end = len(text)
+            mask[pos + 2:line_end] = b'\x01' * max(0, line_end - pos - 2)
+            pos = text.find('//', line_end)
+        return mask
+
+    @staticmethod
+    def _choose_match(chosen: Dict, key: str, start: int, end: int, is_commented: int):
+        """记录键的候选匹配：优先未注释的，其次是第一个被注释的"""
+        previous = chosen.get(key)
+        if previous is None or (previous[2] and not is_commented):
+            chosen[key] = (start, end, is_commented)
+
+    @staticmethod
+    def _scan_quoted_pairs(content: str, keys: set, comment_mask: bytearray, chosen: Dict):
+        """快速路径：用 str.find 逐个定位双引号，识别 "键": "值" 形式的键值对"""
+        find = content.find
+        length = len(content)
+        key_lengths = {len(key) for key in keys}
+        pos = find('"')
+        while pos != -1:
+            key_end = find('"', pos + 1)
+            if key_end == -1:
+                break
+            if key_end - pos - 1 in key_lengths and content[pos + 1:key_end] in keys:
+                p = key_end + 1
+                while p < length and content[p].isspace():
+                    p += 1
+                if p < length and content[p] == ':':
+                    p += 1
+                    while p < length and content[p].isspace():
+                        p += 1
+                    if p < length and content[p] == '"':
+                        value_end = FileTool._find_closing_quote(content, '"', p + 1)
+                        if value_end != -1:
+                            # 如果这一行在键之前有 //，则认为是注释掉的
+                            FileTool._choose_match(chosen, content[pos + 1:key_end], pos, value_end + 1,
+                                                   comment_mask[pos])
+                            pos = find('"', value_end + 1)
+                            continue
+            pos = find('"', pos + 1)
+
+    @staticmethod
+    def _apply_all_replacements(content: str, translation_data: Dict, original_data: Dict) -> str:
         """
-        使用正则表达式进行精确或模糊匹配
-        优先匹配未注释的键，避免替换被注释掉的键
+        一次扫描完成所有键的替换，最后统一拼接
+        每个键优先替换未注释的匹配，没有时才替换第一个被注释的匹配
         """
-        escaped_key = re.escape(key)
+        keys = [key for key in translation_data if key in original_data]
+        if not keys:
+            return content
 
-        # 先查找所有匹配的位置（包括注释和未注释的）
-        all_matches = []
-        
-        # 对于多行值，总是使用DOTALL标志
-        flags = re.DOTALL
-        
-        # 构建匹配键的正则模式，支持多行字符串
-        patterns = [
-            # 双引号键 + 任意值（支持转义字符和多行）
-            f'"{escaped_key}"\\s*:\\s*"(?:[^"\\\\]|\\\\.)*"',
-            # 单引号键 + 任意值
-            f"'{escaped_key}'\\s*:\\s*'(?:[^'\\\\]|\\\\.)*'",
-            # 无引号键 + 任意值
-            f'{escaped_key}\\s*:\\s*"(?:[^"\\\\]|\\\\.)*"',
-        ]
-
-        # 收集所有匹配项及其位置
-        for pattern in patterns:
-            for match in re.finditer(pattern, content, flags):
-                # 检查这个匹配是否被注释掉了
-                start_pos = match.start()
-                # 向前查找，看看这一行是否以 // 开头
-                line_start = content.rfind('\n', 0, start_pos) + 1
-                line_content = content[line_start:start_pos]
-                
-                # 如果这一行在键之前有 //（忽略空格），则认为是注释掉的
-                is_commented = '//' in line_content
-                
-                all_matches.append({
-                    'match': match,
-                    'is_commented': is_commented,
-                    'pattern': pattern
-                })
-
-        # 优先选择未注释的匹配
-        for item in all_matches:
-            if not item['is_commented']:
-                match = item['match']
-                # 使用 json.dumps 确保多行字符串正确格式化
-                replacement = f'"{key}": {json.dumps(new_value, ensure_ascii=False)}'
-                return content[:match.start()] + replacement + content[match.end():]
-
-        # 如果没有未注释的，才使用注释的
-        if all_matches:
-            match = all_matches[0]['match']
-            replacement = f'"{key}": {json.dumps(new_value, ensure_ascii=False)}'
-            return content[:match.start()] + replacement + content[match.end():]
-
-        return content
+        comment_mask = FileTool._build_comment_mask(content)
+        # 键 -> (起点, 终点, 是否被注释)
+        chosen = {}
+        FileTool._scan_quoted_pairs(content, set(keys), comment_mask, chosen)
+
+        # 快速路径没找到未注释匹配的键（单引号、无引号键等），再用正则兜底
+        rest = [key for key in keys if key not in chosen or chosen[key][2]]
+        if rest:
+            spans = sorted((start, end) for start, end, _ in chosen.values())
+            starts = [start for start, _ in spans]
+            for match in _compile_keys_regex(rest).finditer(content):
+                start, end = match.span()
+                # 跳过与快速路径结果重叠的匹配
+                i = bisect.bisect_right(starts, start) - 1
+                if (i >= 0 and spans[i][1] > start) or (i + 1 < len(spans) and spans[i + 1][0] < end):
+                    continue
+                FileTool._choose_match(chosen, match.group(match.lastgroup), start, end, comment_mask[start])
+
+        parts = []
+        cursor = 0
+        for key, (start, end, _) in sorted(chosen.items(), key=lambda item: item[1][0]):
+            parts.append(content[cursor:start])
+            # 使用 json.dumps 确保多行字符串正确格式化
+            parts.append(f'"{key}": {json.dumps(translation_data[key], ensure_ascii=False)}')
+            cursor = end
+        parts.append(content[cursor:])
+        return ''.join(parts)
 
     @staticmethod
     def get_all_json_files(folder: str) -> List[str]:
@@ -315,6 +412,43 @@ class FileTool(QObject):
         folder_path = Path(folder)
         return [str(file_path) for file_path in folder_path.rglob('*.json')]
 
+    @staticmethod
+    def _walk_json_files(folder: str) -> Iterator[str]:
+        """用 os.scandir 递归遍历文件夹，产出所有JSON文件路径"""
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif os.path.normcase(entry.name).endswith('.json'):
+                yield entry.path
+        for subdir in subdirs:
+            yield from FileTool._walk_json_files(subdir)
+
+    @staticmethod
+    def _try_read_json_file(file_path: str):
+        """读取JSON文件，失败时返回 None"""
+        try:
+            return FileTool.read_json_file(file_path)
+        except Exception:
+            return None
+
+    @staticmethod
+    def read_all_json_files(folder: str) -> Dict[str, Any]:
+        """
+        并发读取文件夹中所有JSON文件
+        返回 {文件路径: 数据}，按遍历顺序排列，读取失败的文件对应 None
+        """
+        paths = list(FileTool._walk_json_files(folder))
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            return dict(zip(paths, executor.map(FileTool._try_read_json_file, paths)))
+
     @staticmethod
     def open_folder(folder_path: str) -> bool:
         """打开文件夹"""
@@ -327,10 +461,14 @@ class FileTool(QObject):
             # 如果os.startfile不可用，尝试其他方法
             try:
                 import subprocess
+                # 使用参数列表直接启动，不经过命令行字符串解析
                 if os.name == 'nt':  # Windows
-                    subprocess.Popen(f'explorer "{folder_path}"')
-                elif os.name == 'posix':  # Linux or macOS
-                    subprocess.Popen(['xdg-open', folder_path])
+                    subprocess.Popen(['explorer', os.path.normpath(folder_path)], shell=False, close_fds=True,
+                                     creationflags=getattr(subprocess, 'DETACHED_PROCESS', 0))
+                elif sys.platform == 'darwin':  # macOS
+                    subprocess.Popen(['open', folder_path], shell=False, close_fds=True)
+                elif os.name == 'posix':  # Linux
+                    subprocess.Popen(['xdg-open', folder_path], shell=False, close_fds=True)
                 return True
             except Exception:
                 return False
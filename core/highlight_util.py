@@ -1,10 +1,14 @@
 # ui/highlight_util.py
+import re
 from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextDocument
 from PySide6.QtCore import QRegularExpression, QTimer
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from core.variable_protector import VariableProtector
 
+# 超出 BMP 的字符在 Qt 中占两个 UTF-16 单元，此时 Python 下标与 Qt 位置不一致
+_ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+
 
 class VariableHighlighter(QSyntaxHighlighter):
     """变量高亮器 - 使用淡黄色高亮所有变量"""
@@ -13,6 +17,11 @@ class VariableHighlighter(QSyntaxHighlighter):
     MAX_TEXT_LENGTH = 10000  # 最大处理文本长度
     REHIGHLIGHT_DELAY = 50  # 重新高亮延迟（毫秒）
 
+    # 类级别的正则缓存：模式字符串 -> 已编译的 Qt 正则，所有高亮器实例共享
+    _qre_cache: Dict[str, QRegularExpression] = {}
+    # 同一模式的 Python 正则缓存（模式不兼容 Python 语法时为 None）
+    _py_re_cache: Dict[str, Optional[re.Pattern]] = {}
+
     def __init__(self, document: Optional[QTextDocument] = None, theme: str = "light"):
         """初始化高亮器"""
         super().__init__(document)
@@ -25,12 +34,55 @@ class VariableHighlighter(QSyntaxHighlighter):
         # 获取编译好的正则表达式
         protector = VariableProtector()
         self._compiled_patterns = protector.get_pattern_string()
+        self._qre = self._get_qre(self._compiled_patterns)
+        self._py_re = self._get_py_re(self._compiled_patterns)
+        # 默认模式的候选首字符，用于快速跳过不含变量的文本块
+        self._sentinel_set = frozenset(protector.get_sentinel_chars())
+        self._update_enabled()
 
         # 初始化延迟重新高亮的计时器
         self._rehighlight_timer = QTimer()
         self._rehighlight_timer.setSingleShot(True)
         self._rehighlight_timer.setInterval(self.REHIGHLIGHT_DELAY)
 
+    @staticmethod
+    def _pattern_string(patterns) -> str:
+        """把模式字符串或模式列表统一为一个模式字符串"""
+        if not patterns or isinstance(patterns, str):
+            return patterns or ''
+        return '|'.join(p.pattern() if isinstance(p, QRegularExpression) else str(p) for p in patterns)
+
+    @classmethod
+    def _get_qre(cls, patterns) -> Optional[QRegularExpression]:
+        """获取（必要时编译并缓存）模式对应的 Qt 正则表达式"""
+        patterns = cls._pattern_string(patterns)
+        if not patterns:
+            return None
+        qre = cls._qre_cache.get(patterns)
+        if qre is None:
+            qre = QRegularExpression(patterns)
+            # 立即编译（可用时启用 JIT），避免首次匹配时再编译
+            qre.optimize()
+            cls._qre_cache[patterns] = qre
+        return qre
+
+    @classmethod
+    def _get_py_re(cls, patterns) -> Optional[re.Pattern]:
+        """获取（必要时编译并缓存）模式对应的 Python 正则表达式"""
+        patterns = cls._pattern_string(patterns)
+        if not patterns:
+            return None
+        if patterns not in cls._py_re_cache:
+            try:
+                cls._py_re_cache[patterns] = re.compile(patterns)
+            except re.error:
+                cls._py_re_cache[patterns] = None
+        return cls._py_re_cache[patterns]
+
+    def _update_enabled(self):
+        """没有可用的正则时直接关闭高亮，highlightBlock 无需进入匹配逻辑"""
+        self._enabled = self._qre is not None and self._qre.isValid()
+
     @staticmethod
     def _create_highlight_format(theme: str = "light") -> QTextCharFormat:
         """创建高亮格式"""
@@ -50,14 +102,18 @@ class VariableHighlighter(QSyntaxHighlighter):
 
     def highlightBlock(self, text: str):
         """高亮文本块中的所有变量 - 优化版本"""
-        # 空文本检查
-        if not text:
+        # 未启用或空文本检查
+        if not self._enabled or not text:
             return
 
         # 长度限制检查
         if len(text) > self.MAX_TEXT_LENGTH:
             return
 
+        # 不含任何候选首字符的文本块一定没有变量
+        if self._sentinel_set is not None and not any(c in text for c in self._sentinel_set):
+            return
+
         try:
             self._apply_highlighting(text)
         except Exception:
@@ -66,22 +122,29 @@ class VariableHighlighter(QSyntaxHighlighter):
 
     def _apply_highlighting(self, text: str):
         """应用高亮逻辑"""
-        if not self._compiled_patterns:
+        fmt = self._highlight_format
+        # 快速路径：Python 正则直接给出整数区间，省去 Qt 迭代器的逐次调用
+        if self._py_re is not None and not _ASTRAL_RE.search(text):
+            set_format = self.setFormat
+            for match in self._py_re.finditer(text):
+                start, end = match.span()
+                set_format(start, end - start, fmt)
             return
 
-        # 直接使用字符串创建 Qt 正则表达式
-        pattern = QRegularExpression(self._compiled_patterns)
-
-        if pattern.isValid():
-            iterator = pattern.globalMatch(text)
-            while iterator.hasNext():
-                match = iterator.next()
-                if match.hasMatch():
-                    self.setFormat(match.capturedStart(), match.capturedLength(), self._highlight_format)
+        iterator = self._qre.globalMatch(text)
+        while iterator.hasNext():
+            match = iterator.next()
+            if match.hasMatch():
+                self.setFormat(match.capturedStart(), match.capturedLength(), fmt)
 
     def set_patterns(self, patterns: List[QRegularExpression]):
         """设置新的正则表达式模式"""
         self._compiled_patterns = patterns
+        self._qre = self._get_qre(patterns)
+        self._py_re = self._get_py_re(patterns)
+        # 自定义模式的首字符未知，关闭预过滤
+        self._sentinel_set = None
+        self._update_enabled()
         self.delayed_rehighlight()
 
     def delayed_rehighlight(self):
@@ -1,9 +1,17 @@
+import functools
 import os
 import json
 import os
+import re
 import shutil
+import stat
+import sys
+import threading
+import types
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from PySide6.QtCore import Qt
 from core.config import config
@@ -11,21 +19,156 @@ from core.signal_bus import signal_bus
 from core.file_tool import file_tool
 from core.translation_executor import TranslationExecutor
 
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库
+    orjson = None
+
+# 可能是中文翻译文件的文件名特征（忽略大小写）
+_ZH_NAME_RE = re.compile(r'zh|chinese|cn', re.IGNORECASE)
+
+# 是否输出调试日志；关闭时不发射 DEBUG 信号，逐字段的调试信息也不再格式化
+_DEBUG_ENABLED = config.get('log_level', 'DEBUG') == 'DEBUG'
+
+
+def _fast_dump(data, path: str):
+    """紧凑格式写出大型JSON（质量检查的合并文件），不缩进，中文不转义"""
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(body)
+
+
+def _read_json_result(path: str):
+    """读取JSON文件，返回 (数据, 异常)，异常交给调用方按文件记录日志"""
+    try:
+        return file_tool.read_json_file(path), None
+    except Exception as e:
+        return None, e
+
+
+def _read_json_files(paths: List[str]) -> List[tuple]:
+    """用线程池并发读取多个JSON文件，按传入顺序返回 (数据, 异常) 列表"""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return list(executor.map(_read_json_result, paths))
+
+
+@functools.lru_cache(maxsize=None)
+def _quality_check_ui() -> types.SimpleNamespace:
+    """首次打开质量检查窗口时再导入界面模块，之后重复使用同一组引用"""
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QDialog, QVBoxLayout, QApplication, QWidget
+    from ui.quality_check_widget import QualityCheckWidget
+    from ui.widgets import BackgroundWidget
+    from ui.custom_title_bar import CustomTitleBar
+    from ui.styles import get_main_window_style
+    return types.SimpleNamespace(
+        QTimer=QTimer, QDialog=QDialog, QVBoxLayout=QVBoxLayout,
+        QApplication=QApplication, QWidget=QWidget,
+        QualityCheckWidget=QualityCheckWidget, BackgroundWidget=BackgroundWidget,
+        CustomTitleBar=CustomTitleBar, get_main_window_style=get_main_window_style,
+    )
+
+
+def _quality_check_key(mod_name: str, key: str) -> str:
+    """质量检查合并数据的唯一键：mod文件夹名/原始键名（文件夹名不含 /，不会冲突）"""
+    return f"{mod_name}/{key}"
+
+
+# 缓冲日志达到该条数时立即发送一批
+_LOG_BATCH_SIZE = 50
+
+
+def _dbg(message: str):
+    """输出调试日志（未开启调试时直接跳过信号发射）"""
+    if _DEBUG_ENABLED:
+        signal_bus.log_message.emit("DEBUG", message, {})
+
+
+def _force_remove(func, path, exc):
+    """删除失败时去掉只读属性后重试（等同 rd /s /q 的效果）"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _force_rmtree(path: str):
+    """强制删除整个文件夹，包括只读文件"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_force_remove)
+    else:
+        shutil.rmtree(path, onerror=_force_remove)
+
 
 class OneClickUpdateProcessor:
     """一键更新处理器 - 纯粘合剂，只负责调用其他模块的功能"""
     
     def __init__(self, project_manager=None):
+        global _DEBUG_ENABLED
+        # 每次创建处理器时按当前配置刷新调试开关
+        _DEBUG_ENABLED = config.get('log_level', 'DEBUG') == 'DEBUG'
         self.project_manager = project_manager
         self.translation_executor = TranslationExecutor(project_manager)
         self._is_running = True
-        self._user_processed = None
+        # 等待用户处理人名地名检测结果：单个等待方、单个通知方
+        self._user_processed_cond = threading.Condition()
+        self._user_processed_done = False
         self._should_continue = True
+        # 热路径日志缓冲：合并为 log_batch 信号批量发送，减少跨线程信号派发
+        self._log_buffer: List[Tuple[str, str, dict]] = []
+        self._log_lock = threading.Lock()
+        # 项目文件夹路径缓存：(项目路径, 文件夹类型) -> 路径
+        self._folder_cache: Dict[Tuple[Optional[str], str], str] = {}
         
+    def _get_folder_path(self, folder_type: str) -> str:
+        """获取项目文件夹路径，首次获取时由 project_manager 创建文件夹；以项目路径为键，切换项目后自动重新获取"""
+        project = getattr(self.project_manager, 'current_project', None)
+        cache_key = (project.path if project else None, folder_type)
+        folder_path = self._folder_cache.get(cache_key)
+        if folder_path is None:
+            folder_path = self.project_manager.get_folder_path(folder_type)
+            if folder_path:
+                self._folder_cache[cache_key] = folder_path
+        return folder_path
+
     def stop(self):
         """停止处理"""
         self._is_running = False
         self.translation_executor.stop()
+        # 唤醒可能正在等待用户处理的线程
+        with self._user_processed_cond:
+            self._user_processed_cond.notify_all()
+    
+    def mark_user_processed(self):
+        """通知用户已处理完检测结果，继续执行"""
+        with self._user_processed_cond:
+            self._user_processed_done = True
+            self._user_processed_cond.notify_all()
+    
+    def _log(self, level: str, message: str):
+        """缓冲一条日志；SUCCESS/ERROR 先清空缓冲再立即发送，保持日志顺序"""
+        if level == "DEBUG" and not _DEBUG_ENABLED:
+            return
+        if level in ("SUCCESS", "ERROR"):
+            self._flush_logs()
+            signal_bus.log_message.emit(level, message, {})
+            return
+        with self._log_lock:
+            self._log_buffer.append((level, message, {}))
+            full = len(self._log_buffer) >= _LOG_BATCH_SIZE
+        if full:
+            self._flush_logs()
+    
+    def _flush_logs(self):
+        """把缓冲的日志作为一批发送出去"""
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            records, self._log_buffer = self._log_buffer, []
+        signal_bus.log_batch.emit(records)
     
     def process(self, params: Dict) -> Dict[str, Any]:
         """执行一键更新"""
@@ -55,7 +198,7 @@ class OneClickUpdateProcessor:
                     return {'成功': False, '消息': '多文件夹模式下，英文和中文mod文件夹名称必须对应匹配'}
             
             # 使用project_manager获取输出文件夹路径
-            output_folder = self.project_manager.get_folder_path('output')
+            output_folder = self._get_folder_path('output')
             signal_bus.log_message.emit("INFO", f"输出文件夹路径: {output_folder}", {})
             
             # 步骤1: 人名地名检测（如果未跳过）
@@ -64,23 +207,25 @@ class OneClickUpdateProcessor:
                 if not detection_result['成功']:
                     return detection_result
                 
+                # 在发送信号前重置状态，避免界面先于等待开始就完成处理
+                with self._user_processed_cond:
+                    self._user_processed_done = False
+                self._should_continue = True
+                
                 # 发送检测完成信号
                 signal_bus.nameDetectionCompleted.emit(detection_result)
                 
-                # 等待用户处理完成
-                import threading
-                import time
-                
-                # 创建事件来等待用户处理完成
-                self._user_processed = threading.Event()
-                self._should_continue = True
-                
                 # 暂停执行，等待用户处理
                 signal_bus.log_message.emit("INFO", "等待用户处理人名地名检测结果...", {})
                 
-                # 等待最多5分钟
-                if not self._user_processed.wait(timeout=300):
+                # 等待最多5分钟，停止处理时立即返回
+                with self._user_processed_cond:
+                    finished = self._user_processed_cond.wait_for(
+                        lambda: self._user_processed_done or not self._is_running, timeout=300)
+                if not finished:
                     signal_bus.log_message.emit("WARNING", "等待超时，继续执行翻译", {})
+                elif not self._is_running:
+                    return {'成功': False, '消息': '用户停止'}
                 
                 # 检查是否应该继续
                 if not self._should_continue:
@@ -103,7 +248,16 @@ class OneClickUpdateProcessor:
             from ui.tabs.tab_name_detection import SmartNameExtractor
             
             extractor = SmartNameExtractor()
-            all_pairs = []
+            min_confidence = 0.6
+            # (英文, 中文) -> 检测结果，收集时即去重；同一对优先保留能通过置信度过滤的那条
+            unique_pairs = {}
+            
+            def add_pairs(pairs):
+                for pair in pairs:
+                    key = (pair['en'], pair['zh'])
+                    existing = unique_pairs.get(key)
+                    if existing is None or (existing['confidence'] < min_confidence <= pair['confidence']):
+                        unique_pairs[key] = pair
             
             # 处理每一对英文和中文mod文件夹
             total_pairs = min(len(en_paths), len(zh_paths))
@@ -127,43 +281,34 @@ class OneClickUpdateProcessor:
                 zh_file = os.path.join(zh_i18n_folder, 'zh.json')
                 
                 if os.path.exists(default_file) and os.path.exists(zh_file):
-                    pairs = extractor.load_and_match_files(default_file, zh_file, en_mod_folder)
-                    all_pairs.extend(pairs)
+                    add_pairs(extractor.load_and_match_files(default_file, zh_file, en_mod_folder))
                 
                 # 处理第二种情况：有Default和Zh文件夹
                 default_folder = os.path.join(en_i18n_folder, 'Default')
                 zh_folder = os.path.join(zh_i18n_folder, 'Zh')
                 
                 if os.path.exists(default_folder) and os.path.exists(zh_folder):
-                    # 获取两个文件夹中的所有json文件
-                    default_files = [f for f in os.listdir(default_folder) if f.endswith('.json')]
-                    zh_files = [f for f in os.listdir(zh_folder) if f.endswith('.json')]
+                    # 获取两个文件夹中的所有json文件（中文文件名用集合便于查找）
+                    with os.scandir(default_folder) as it:
+                        default_entries = [e for e in it if e.is_file() and e.name.endswith('.json')]
+                    with os.scandir(zh_folder) as it:
+                        zh_files = {e.name for e in it if e.is_file() and e.name.endswith('.json')}
                     
-                    # 匹配相同文件名的文件
-                    for filename in default_files:
-                        if filename in zh_files:
-                            default_path = os.path.join(default_folder, filename)
-                            zh_path = os.path.join(zh_folder, filename)
-                            pairs = extractor.load_and_match_files(default_path, zh_path, en_mod_folder)
-                            all_pairs.extend(pairs)
-            
-            # 过滤和去重
-            if all_pairs:
-                filtered_pairs = extractor.smart_filter_names(all_pairs, min_confidence=0.6)
-                # 去重
-                seen_pairs = set()
-                unique_pairs = []
-                for pair in filtered_pairs:
-                    key = (pair['en'], pair['zh'])
-                    if key not in seen_pairs:
-                        seen_pairs.add(key)
-                        unique_pairs.append(pair)
+                    # 匹配相同文件名的文件（保持英文目录中的顺序）
+                    for entry in default_entries:
+                        if entry.name in zh_files:
+                            zh_path = os.path.join(zh_folder, entry.name)
+                            add_pairs(extractor.load_and_match_files(entry.path, zh_path, en_mod_folder))
+            
+            # 过滤（收集时已去重）
+            if unique_pairs:
+                filtered_pairs = extractor.smart_filter_names(list(unique_pairs.values()), min_confidence=min_confidence)
                 
-                signal_bus.log_message.emit("SUCCESS", f"人名地名检测完成，检测到 {len(unique_pairs)} 个术语", {})
+                signal_bus.log_message.emit("SUCCESS", f"人名地名检测完成，检测到 {len(filtered_pairs)} 个术语", {})
                 return {
                     '成功': True,
-                    '检测结果': unique_pairs,
-                    '消息': f'检测到 {len(unique_pairs)} 个人名地名'
+                    '检测结果': filtered_pairs,
+                    '消息': f'检测到 {len(filtered_pairs)} 个人名地名'
                 }
             else:
                 signal_bus.log_message.emit("INFO", "未检测到需要处理的人名地名", {})
@@ -183,39 +328,37 @@ class OneClickUpdateProcessor:
             # 先清理项目的en、zh和output文件夹
             signal_bus.log_message.emit("INFO", "清理项目文件夹...", {})
             
-            en_folder = self.project_manager.get_folder_path('en')
-            zh_folder = self.project_manager.get_folder_path('zh')
-            output_folder = self.project_manager.get_folder_path('output')
+            en_folder = self._get_folder_path('en')
+            zh_folder = self._get_folder_path('zh')
+            output_folder = self._get_folder_path('output')
             
-            # 清空en文件夹
-            if os.path.exists(en_folder):
-                shutil.rmtree(en_folder)
+            # 清空en文件夹（直接删除，不存在时忽略）
+            try:
+                _force_rmtree(en_folder)
                 signal_bus.log_message.emit("INFO", "已清理en文件夹", {})
+            except FileNotFoundError:
+                pass
             
             # 清空zh文件夹
-            if os.path.exists(zh_folder):
-                shutil.rmtree(zh_folder)
+            try:
+                _force_rmtree(zh_folder)
                 signal_bus.log_message.emit("INFO", "已清理zh文件夹", {})
+            except FileNotFoundError:
+                pass
             
             # 清空output文件夹
-            if os.path.exists(output_folder):
-                import subprocess
-                
-                # 直接使用Windows命令删除文件夹
-                try:
-                    # 使用rd命令删除文件夹，确保路径格式正确
-                    # 将正斜杠转换为反斜杠，Windows命令更喜欢反斜杠
-                    windows_path = output_folder.replace('/', '\\')
-                    result = subprocess.run(['cmd', '/c', 'rd', '/s', '/q', windows_path], 
-                                           capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        signal_bus.log_message.emit("INFO", "已清理output文件夹", {})
-                    else:
-                        signal_bus.log_message.emit("ERROR", f"删除output文件夹失败: {result.stderr}", {})
-                        raise PermissionError(f"无法删除output文件夹")
-                except Exception as e:
-                    signal_bus.log_message.emit("ERROR", f"删除output文件夹失败: {str(e)}", {})
-                    raise
+            try:
+                _force_rmtree(output_folder)
+                signal_bus.log_message.emit("INFO", "已清理output文件夹", {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                signal_bus.log_message.emit("ERROR", f"删除output文件夹失败: {str(e)}", {})
+                raise
+            
+            # 重新创建清空后的文件夹，后续直接使用上面取得的路径
+            for folder in (en_folder, zh_folder, output_folder):
+                os.makedirs(folder, exist_ok=True)
             
             # 收集所有要翻译的文件到项目文件夹
             signal_bus.log_message.emit("INFO", "收集所有mod文件夹中的翻译文件...", {})
@@ -227,151 +370,57 @@ class OneClickUpdateProcessor:
             # 检查是否是单文件夹模式
             is_single_folder = len(en_paths) == 1 and len(zh_paths) == 1
             
-            # 收集每个英文mod的文件
-            for i, en_path in enumerate(en_paths):
-                mod_name = Path(en_path).name
-                signal_bus.log_message.emit("INFO", f"收集mod {i+1}/{len(en_paths)}: {mod_name} 的翻译文件", {})
-                signal_bus.log_message.emit("DEBUG", f"mod_name实际值: '{mod_name}'", {})
-                
-                # 收集英文文件
-                self._collect_translation_files(
-                    os.path.join(en_path, 'i18n'),
-                    en_folder,
-                    mod_name
-                )
-                
-                # 查找对应的中文mod（根据文件夹名称）
-                zh_path = zh_mod_map.get(mod_name)
-                if zh_path and os.path.exists(os.path.join(zh_path, 'i18n')):
-                    signal_bus.log_message.emit("DEBUG", f"找到对应的中文mod: {zh_path}", {})
-                    self._collect_chinese_files(
-                        os.path.join(zh_path, 'i18n'),
-                        zh_folder,
-                        mod_name
-                    )
-                else:
-                    # 在单文件夹模式下，如果只有一个中文mod路径，使用英文mod名作为前缀
-                    if is_single_folder and len(zh_paths) == 1:
-                        zh_path = zh_paths[0]
-                        if os.path.exists(os.path.join(zh_path, 'i18n')):
-                            signal_bus.log_message.emit("INFO", f"单文件夹模式：使用英文mod名 '{mod_name}' 作为中文文件前缀", {})
-                            self._collect_chinese_files(
-                                os.path.join(zh_path, 'i18n'),
-                                zh_folder,
-                                mod_name  # 使用英文mod名作为前缀
-                            )
-                        else:
-                            signal_bus.log_message.emit("WARNING", f"中文mod路径不存在i18n文件夹: {zh_path}", {})
-                    else:
-                        signal_bus.log_message.emit("WARNING", f"未找到对应的中文mod: {mod_name}", {})
-            
             # 先收集所有需要翻译的内容
             all_translation_data = {}
             manifest_data = {}
             config_data = {}
-            
-            # 处理每个英文mod文件夹，收集翻译内容
-            for i, en_path in enumerate(en_paths):
-                if not self._is_running:
-                    break
+            # 相同英文只翻译一次：原文 -> 代表键，代表键 -> 重复键列表
+            value_to_canon = {}
+            dup_map = {}
+            # 各mod中文版已有的译文，重复键优先保留自己的译文
+            existing_zh = {}
+            
+            # 并发处理每个英文mod文件夹（一次完成文件收集和内容提取），按原顺序合并翻译内容
+            with ThreadPoolExecutor(max_workers=min(8, len(en_paths)) or 1) as executor:
+                futures = [
+                    executor.submit(self._collect_mod, i, len(en_paths), en_path, en_folder, zh_folder,
+                                    zh_mod_map, zh_paths, is_single_folder)
+                    for i, en_path in enumerate(en_paths)
+                ]
+                for future in futures:
+                    mod_contents, mod_manifest_data, mod_config_data, mod_zh_values = future.result()
+                    manifest_data.update(mod_manifest_data)
+                    config_data.update(mod_config_data)
+                    existing_zh.update(mod_zh_values)
                     
-                mod_name = Path(en_path).name
-                signal_bus.log_message.emit("INFO", f"收集mod {i+1}/{len(en_paths)}: {mod_name} 的翻译内容", {})
-                signal_bus.log_message.emit("DEBUG", f"en_path: {en_path}", {})
-                
-                # 查找对应的中文mod（根据文件夹名称）
-                zh_path = zh_mod_map.get(mod_name)
-                if zh_path:
-                    signal_bus.log_message.emit("DEBUG", f"找到对应的中文mod: {zh_path}", {})
-                else:
-                    # 在单文件夹模式下，如果只有一个中文mod路径，直接使用它
-                    if len(zh_paths) == 1:
-                        zh_path = zh_paths[0]
-                    else:
-                        signal_bus.log_message.emit("WARNING", f"未找到对应的中文mod: {mod_name}", {})
-                        zh_path = None  # 设置为None，后续代码会处理
-                
-                # 1. 收集i18n文件（已在前面完成）
-                
-                # 2. 收集manifest文件
-                en_manifest = os.path.join(en_path, 'manifest.json')
-                zh_manifest = os.path.join(zh_path, 'manifest.json') if zh_path else None
-                
-                if os.path.exists(en_manifest):
-                    manifest_content = self._extract_manifest_fields(en_manifest)
-                    if manifest_content:
-                        # 保存到en文件夹，键名添加前缀
-                        en_content_with_prefix = {}
-                        for key, value in manifest_content.items():
-                            en_content_with_prefix[f"{mod_name}_{key}"] = value
-                        
-                        en_file = os.path.join(en_folder, f"{mod_name}_manifest.json")
-                        file_tool.save_json_file(en_content_with_prefix, en_file)
-                        
-                        # 如果有中文版本，也保存到zh文件夹
-                        if os.path.exists(zh_manifest):
-                            zh_manifest_data = file_tool.read_json_file(zh_manifest)
-                            zh_content = {}
-                            for key in manifest_content.keys():
-                                if key in zh_manifest_data and zh_manifest_data[key]:
-                                    zh_content[f"{mod_name}_{key}"] = zh_manifest_data[key]
-                            
-                            if zh_content:
-                                zh_file = os.path.join(zh_folder, f"{mod_name}_manifest.json")
-                                file_tool.save_json_file(zh_content, zh_file)
-                                signal_bus.log_message.emit("INFO", f"保存中文manifest文件: {zh_file}，包含 {len(zh_content)} 项", {})
-                        
-                        # 添加到翻译数据
-                        for key, value in manifest_content.items():
-                            # 使用与翻译引擎输出一致的键名格式
-                            unique_key = f"{mod_name}_{key}"
-                            all_translation_data[unique_key] = value
-                            manifest_data[unique_key] = {
-                                'mod_name': mod_name,
-                                'key': key,  # 保存原始键名
-                                'en_path': en_manifest,
-                                'zh_path': zh_manifest if os.path.exists(zh_manifest) else None
-                            }
-                
-                # 3. 收集content文件（与单多文件夹无关，只看i18n结构）
-                en_content = os.path.join(en_path, 'content.json')
-                signal_bus.log_message.emit("DEBUG", f"检查content.json: {en_content}", {})
-                if os.path.exists(en_content):
-                    signal_bus.log_message.emit("DEBUG", f"找到content.json文件，开始提取字段", {})
-                    config_content = self._extract_config_fields(file_tool.read_json_file(en_content))
-                    signal_bus.log_message.emit("DEBUG", f"提取到 {len(config_content)} 个配置字段", {})
-                    if config_content:
-                        # 保存到en文件夹，键名添加前缀
-                        en_content_with_prefix = {}
-                        for key, value in config_content.items():
-                            en_content_with_prefix[f"{mod_name}_{key}"] = value
-                        
-                        en_file = os.path.join(en_folder, f"{mod_name}_content.json")
-                        file_tool.save_json_file(en_content_with_prefix, en_file)
+                    for file_name, content in mod_contents:
+                        unique_content = {}
+                        for unique_key, value in content.items():
+                            canon = value_to_canon.get(value)
+                            if canon is None:
+                                value_to_canon[value] = unique_key
+                                unique_content[unique_key] = value
+                            else:
+                                dup_map.setdefault(canon, []).append(unique_key)
                         
-                        # 添加到翻译数据
-                        for key, value in config_content.items():
-                            # 使用与翻译引擎输出一致的键名格式
-                            unique_key = f"{mod_name}_{key}"
-                            all_translation_data[unique_key] = value
-                            config_data[unique_key] = {
-                                'mod_name': mod_name,
-                                'key': key,  # 保存原始键名
-                                'en_path': en_content
-                            }
+                        # 只把首次出现的原文保存到en文件夹参与翻译
+                        if unique_content:
+                            file_tool.save_json_file(unique_content, os.path.join(en_folder, file_name))
+                            all_translation_data.update(unique_content)
+            self._flush_logs()
+            
+            if dup_map:
+                dup_count = sum(len(keys) for keys in dup_map.values())
+                signal_bus.log_message.emit("INFO", f"跳过 {dup_count} 项重复原文，翻译后直接复用", {})
             
             # 执行一次统一的翻译
             if all_translation_data:
                 signal_bus.log_message.emit("INFO", "开始统一翻译所有内容...", {})
                 
-                # 保存到临时文件
-                temp_file = os.path.join(self.project_manager.get_folder_path('output'), 'temp_translation.json')
-                file_tool.save_json_file(all_translation_data, temp_file)
-                
                 # 准备翻译参数
                 params = {
                     '原始文件夹': en_folder,
-                    '输出文件夹': self.project_manager.get_folder_path('output'),
+                    '输出文件夹': output_folder,
                     '项目路径': self.project_manager.current_project.path
                 }
                 
@@ -383,85 +432,61 @@ class OneClickUpdateProcessor:
                         params['中文文件夹'] = zh_folder
                 
                 # 执行智能翻译
+                self._flush_logs()
                 result = self.translation_executor._execute_smart_translation(params)
                 
                 if result.get('成功'):
                     # 收集翻译结果
                     translated_data = {}
-                    output_folder_path = self.project_manager.get_folder_path('output')
                     
-                    # 读取所有翻译结果文件
-                    for filename in os.listdir(output_folder_path):
-                        if filename.endswith('.json') and filename != 'temp_translation.json':
-                            file_path = os.path.join(output_folder_path, filename)
-                            file_data = file_tool.read_json_file(file_path)
-                            translated_data.update(file_data)
-                            signal_bus.log_message.emit("INFO", f"读取翻译文件 {filename}，包含 {len(file_data)} 项", {})
+                    # 读取所有翻译结果文件，同时记录文件列表供后面按mod复制
+                    output_json_files = []
+                    with os.scandir(output_folder) as it:
+                        for entry in it:
+                            if entry.is_file() and entry.name.endswith('.json'):
+                                output_json_files.append(entry)
+                    for entry in output_json_files:
+                        file_data = file_tool.read_json_file(entry.path)
+                        translated_data.update(file_data)
+                        self._log("INFO", f"读取翻译文件 {entry.name}，包含 {len(file_data)} 项")
+                    self._flush_logs()
+                    
+                    # 按mod名前缀一次性分组，长名字优先，避免 mod 与 mod_extended 互相匹配
+                    mod_names = sorted({Path(p).name for p in en_paths}, key=len, reverse=True)
+                    files_by_mod = defaultdict(list)
+                    for entry in output_json_files:
+                        for name in mod_names:
+                            if entry.name.startswith(name + '_'):
+                                files_by_mod[name].append(entry)
+                                break
+                    
+                    # 重复键优先使用本mod已有的中文译文，没有时才复用代表键的译文
+                    for canon, dup_keys in dup_map.items():
+                        canon_value = translated_data.get(canon)
+                        for dup_key in dup_keys:
+                            value = existing_zh.get(dup_key, canon_value)
+                            if value is not None:
+                                translated_data[dup_key] = value
                     
                     signal_bus.log_message.emit("INFO", f"总共收集到 {len(translated_data)} 项翻译结果", {})
                     
                     
-                    # 处理每个英文mod文件夹的输出
-                    for i, en_path in enumerate(en_paths):
-                        if not self._is_running:
-                            break
-                            
-                        mod_name = Path(en_path).name
-                        signal_bus.log_message.emit("INFO", f"处理mod {i+1}/{len(en_paths)}: {mod_name} 的输出", {})
-                        
-                        # 查找对应的中文mod（根据文件夹名称）
-                        zh_path = zh_mod_map.get(mod_name)
-                        if not zh_path:
-                            # 在单文件夹模式下，如果只有一个中文mod路径，直接使用它
-                            if len(zh_paths) == 1:
-                                zh_path = zh_paths[0]
-                            else:
-                                signal_bus.log_message.emit("WARNING", f"处理输出时未找到对应的中文mod: {mod_name}", {})
-                                zh_path = None  # 设置为None，后续代码会处理
-                        
-                        # 创建该mod在项目output文件夹中的目录
-                        mod_output_dir = os.path.join(output_folder_path, mod_name)
-                        os.makedirs(mod_output_dir, exist_ok=True)
-                        
-                        # 复制整个英文mod文件夹到输出目录
-                        signal_bus.log_message.emit("INFO", f"复制英文mod文件夹到输出目录...", {})
-                        if os.path.exists(mod_output_dir):
-                            shutil.rmtree(mod_output_dir)
-                        shutil.copytree(en_path, mod_output_dir)
-                        
-                        # 处理i18n翻译（从output文件夹中读取已翻译的文件）
-                        mod_i18n_dir = os.path.join(mod_output_dir, 'i18n')
-                        os.makedirs(mod_i18n_dir, exist_ok=True)
-                        
-                        # 复制翻译好的i18n文件
-                        for filename in os.listdir(output_folder_path):
-                            if filename.startswith(mod_name) and filename.endswith('.json'):
-                                src_file = os.path.join(output_folder_path, filename)
-                                dst_file = os.path.join(mod_i18n_dir, filename)
-                                shutil.copy2(src_file, dst_file)
-                        
-                        # 重命名翻译结果文件，移除mod名称前缀
-                        en_i18n_folder = os.path.join(en_path, 'i18n')
-                        self._rename_translated_files(mod_i18n_dir, mod_name, en_i18n_folder)
-                        
-                        # 删除不需要的content.json文件
-                        content_file = os.path.join(mod_i18n_dir, 'content.json')
-                        if os.path.exists(content_file):
-                            os.remove(content_file)
-                        
-                        # 回填manifest翻译
-                        self._backfill_manifest_translation(manifest_data, translated_data, mod_name, mod_output_dir)
-                        
-                        # 回填config翻译
-                        self._backfill_config_translation(config_data, translated_data, mod_name, mod_output_dir)
-                        
-                        # 复制其他文件
-                        self._copy_other_files(en_path, zh_path, mod_output_dir)
+                    # 处理每个英文mod文件夹的输出：各mod写入各自的输出目录，互不依赖，
+                    # 以有限并发重叠各mod的复制和读写（最多4个，避免磁盘争用）
+                    with ThreadPoolExecutor(max_workers=min(4, len(en_paths)) or 1) as executor:
+                        futures = [
+                            executor.submit(self._process_mod_output, i, len(en_paths), en_path, output_folder,
+                                            zh_mod_map, zh_paths, files_by_mod.get(Path(en_path).name, ()),
+                                            manifest_data, config_data, translated_data)
+                            for i, en_path in enumerate(en_paths)
+                        ]
+                        for future in futures:
+                            future.result()
                     
                     # 步骤6: 质量检查将在翻译进度窗口关闭后通过信号触发
                     
                     # 清理临时文件（保留质量检查文件）
-                    self._cleanup_temp_files(output_folder_path)
+                    self._cleanup_temp_files(output_folder)
 
                 else:
                     signal_bus.log_message.emit("ERROR", f"统一翻译失败: {result.get('消息', '未知错误')}", {})
@@ -474,27 +499,232 @@ class OneClickUpdateProcessor:
             
         except Exception as e:
             error_msg = f"翻译处理失败: {str(e)}"
-            signal_bus.log_message.emit("ERROR", error_msg, {})
+            self._log("ERROR", error_msg)
             return {'成功': False, '消息': error_msg}
     
+    def _process_mod_output(self, i: int, total: int, en_path: str, output_folder: str,
+                            zh_mod_map: Dict[str, str], zh_paths: List[str], mod_files: List[os.DirEntry],
+                            manifest_data: Dict, config_data: Dict, translated_data: Dict):
+        """生成单个mod的输出目录：复制英文mod、放入翻译好的i18n文件并回填manifest/config"""
+        if not self._is_running:
+            return
+            
+        mod_name = Path(en_path).name
+        self._log("INFO", f"处理mod {i+1}/{total}: {mod_name} 的输出")
+        
+        # 查找对应的中文mod（根据文件夹名称）
+        zh_path = zh_mod_map.get(mod_name)
+        if not zh_path:
+            # 在单文件夹模式下，如果只有一个中文mod路径，直接使用它
+            if len(zh_paths) == 1:
+                zh_path = zh_paths[0]
+            else:
+                self._log("WARNING", f"处理输出时未找到对应的中文mod: {mod_name}")
+                zh_path = None  # 设置为None，后续代码会处理
+        
+        # 该mod在项目output文件夹中的目录（由copytree创建）
+        mod_output_dir = os.path.join(output_folder, mod_name)
+        
+        # 复制整个英文mod文件夹到输出目录
+        self._log("INFO", f"复制英文mod文件夹到输出目录...")
+        try:
+            _force_rmtree(mod_output_dir)
+        except FileNotFoundError:
+            pass
+        shutil.copytree(en_path, mod_output_dir)
+        
+        # 处理i18n翻译（从output文件夹中读取已翻译的文件）
+        mod_i18n_dir = os.path.join(mod_output_dir, 'i18n')
+        os.makedirs(mod_i18n_dir, exist_ok=True)
+        
+        # 移动翻译好的i18n文件（同一文件夹树内，重命名即可，无需复制内容）
+        for entry in mod_files:
+            dst_file = os.path.join(mod_i18n_dir, entry.name)
+            os.replace(entry.path, dst_file)
+        
+        # 重命名翻译结果文件，移除mod名称前缀
+        en_i18n_folder = os.path.join(en_path, 'i18n')
+        self._rename_translated_files(mod_i18n_dir, mod_name, en_i18n_folder)
+        
+        # 删除不需要的content.json文件
+        content_file = os.path.join(mod_i18n_dir, 'content.json')
+        if os.path.exists(content_file):
+            os.remove(content_file)
+        
+        # 回填manifest翻译
+        self._backfill_manifest_translation(manifest_data, translated_data, mod_name, mod_output_dir)
+        
+        # 回填config翻译
+        self._backfill_config_translation(config_data, translated_data, mod_name, mod_output_dir)
+        
+        # 复制其他文件
+        self._copy_other_files(en_path, zh_path, mod_output_dir)
+        self._flush_logs()
+
+    def _collect_mod(self, i: int, total: int, en_path: str, en_folder: str, zh_folder: str,
+                     zh_mod_map: Dict[str, str], zh_paths: List[str], is_single_folder: bool):
+        """收集单个mod：先复制翻译文件，再提取manifest和content内容，返回值同 _collect_mod_contents"""
+        if not self._is_running:
+            return [], {}, {}, {}
+        mod_name = Path(en_path).name
+        self._log("INFO", f"收集mod {i+1}/{total}: {mod_name}")
+        self._log("DEBUG", f"mod_name实际值: '{mod_name}', en_path: {en_path}")
+        self._collect_mod_files(mod_name, en_path, en_folder, zh_folder, zh_mod_map, zh_paths, is_single_folder)
+        return self._collect_mod_contents(mod_name, en_path, zh_folder, zh_mod_map, zh_paths)
+
+    def _collect_mod_files(self, mod_name: str, en_path: str, en_folder: str, zh_folder: str,
+                           zh_mod_map: Dict[str, str], zh_paths: List[str], is_single_folder: bool):
+        """收集单个mod的英文和中文翻译文件到项目文件夹"""
+
+        # 收集英文文件
+        self._collect_translation_files(
+            os.path.join(en_path, 'i18n'),
+            en_folder,
+            mod_name
+        )
+
+        # 查找对应的中文mod（根据文件夹名称）
+        zh_path = zh_mod_map.get(mod_name)
+        if zh_path and os.path.exists(os.path.join(zh_path, 'i18n')):
+            self._log("DEBUG", f"找到对应的中文mod: {zh_path}")
+            self._collect_chinese_files(
+                os.path.join(zh_path, 'i18n'),
+                zh_folder,
+                mod_name
+            )
+        else:
+            # 在单文件夹模式下，如果只有一个中文mod路径，使用英文mod名作为前缀
+            if is_single_folder and len(zh_paths) == 1:
+                zh_path = zh_paths[0]
+                if os.path.exists(os.path.join(zh_path, 'i18n')):
+                    self._log("INFO", f"单文件夹模式：使用英文mod名 '{mod_name}' 作为中文文件前缀")
+                    self._collect_chinese_files(
+                        os.path.join(zh_path, 'i18n'),
+                        zh_folder,
+                        mod_name  # 使用英文mod名作为前缀
+                    )
+                else:
+                    self._log("WARNING", f"中文mod路径不存在i18n文件夹: {zh_path}")
+            else:
+                self._log("WARNING", f"未找到对应的中文mod: {mod_name}")
+
+    def _collect_mod_contents(self, mod_name: str, en_path: str, zh_folder: str,
+                              zh_mod_map: Dict[str, str], zh_paths: List[str]):
+        """
+        收集单个mod的manifest和content翻译内容
+        返回 ([(en文件名, 带前缀的原文)], manifest信息, config信息, 已有中文译文)，en文件由调用方去重后保存
+        """
+        # 所有键名和文件名共用的mod前缀
+        prefix = mod_name + '_'
+        mod_contents = []
+        manifest_data = {}
+        config_data = {}
+        zh_values = {}  # 带前缀的键 -> 该mod中文版已有的译文，去重回填时优先使用
+
+        # 查找对应的中文mod（根据文件夹名称）
+        zh_path = zh_mod_map.get(mod_name)
+        if zh_path:
+            self._log("DEBUG", f"找到对应的中文mod: {zh_path}")
+        else:
+            # 在单文件夹模式下，如果只有一个中文mod路径，直接使用它
+            if len(zh_paths) == 1:
+                zh_path = zh_paths[0]
+            else:
+                self._log("WARNING", f"未找到对应的中文mod: {mod_name}")
+                zh_path = None  # 设置为None，后续代码会处理
+
+        # 1. 收集i18n文件（已在前面完成）
+
+        # 2. 收集manifest文件
+        en_manifest = os.path.join(en_path, 'manifest.json')
+        zh_manifest = os.path.join(zh_path, 'manifest.json') if zh_path else None
+
+        if os.path.exists(en_manifest):
+            # manifest只解析一次，解析结果直接交给提取函数
+            try:
+                en_manifest_data = file_tool.read_json_file(en_manifest)
+            except Exception as e:
+                self._log("ERROR", f"读取manifest失败: {en_manifest}, 错误: {str(e)}")
+                en_manifest_data = {}
+            manifest_content = self._extract_manifest_fields(en_manifest_data)
+            if manifest_content:
+                # 键名添加前缀，交给调用方保存到en文件夹
+                en_content_with_prefix = {}
+                for key, value in manifest_content.items():
+                    en_content_with_prefix[prefix + key] = value
+                mod_contents.append((prefix + "manifest.json", en_content_with_prefix))
+
+                # 如果有中文版本，也保存到zh文件夹
+                if os.path.exists(zh_manifest):
+                    zh_manifest_data = file_tool.read_json_file(zh_manifest)
+                    zh_content = {}
+                    for key in manifest_content.keys():
+                        if key in zh_manifest_data and zh_manifest_data[key]:
+                            zh_content[prefix + key] = zh_manifest_data[key]
+
+                    if zh_content:
+                        zh_values.update(zh_content)
+                        zh_file = os.path.join(zh_folder, prefix + "manifest.json")
+                        file_tool.save_json_file(zh_content, zh_file)
+                        self._log("INFO", f"保存中文manifest文件: {zh_file}，包含 {len(zh_content)} 项")
+
+                # 记录回填信息
+                for key in manifest_content:
+                    # 使用与翻译引擎输出一致的键名格式
+                    unique_key = prefix + key
+                    manifest_data[unique_key] = {
+                        'mod_name': mod_name,
+                        'key': key,  # 保存原始键名
+                        'en_path': en_manifest,
+                        'zh_path': zh_manifest if os.path.exists(zh_manifest) else None
+                    }
+
+        # 3. 收集content文件（与单多文件夹无关，只看i18n结构）
+        en_content = os.path.join(en_path, 'content.json')
+        self._log("DEBUG", f"检查content.json: {en_content}")
+        if os.path.exists(en_content):
+            self._log("DEBUG", f"找到content.json文件，开始提取字段")
+            en_content_data = file_tool.read_json_file(en_content)
+            config_content = self._extract_config_fields(en_content_data)
+            self._log("DEBUG", f"提取到 {len(config_content)} 个配置字段")
+            if config_content:
+                # 键名添加前缀，交给调用方保存到en文件夹
+                en_content_with_prefix = {}
+                for key, value in config_content.items():
+                    en_content_with_prefix[prefix + key] = value
+                mod_contents.append((prefix + "content.json", en_content_with_prefix))
+
+                # 记录回填信息
+                for key in config_content:
+                    # 使用与翻译引擎输出一致的键名格式
+                    unique_key = prefix + key
+                    config_data[unique_key] = {
+                        'mod_name': mod_name,
+                        'key': key,  # 保存原始键名
+                        'en_path': en_content
+                    }
+        
+        return mod_contents, manifest_data, config_data, zh_values
+    
     def _collect_translation_files(self, source_i18n: str, dest_en_folder: str, mod_name: str):
         """收集要翻译的文件（default.json或Default文件夹中的文件）到项目en文件夹"""
         if not os.path.exists(source_i18n):
             return
         
         os.makedirs(dest_en_folder, exist_ok=True)
+        prefix = mod_name + '_'
         
         # 检查i18n文件夹的结构
         has_subdirs = False
         default_folder = None
         
-        for item in os.listdir(source_i18n):
-            item_path = os.path.join(source_i18n, item)
-            if os.path.isdir(item_path):
-                has_subdirs = True
-                # 查找default文件夹（忽略大小写）
-                if item.lower() == 'default':
-                    default_folder = item_path
+        with os.scandir(source_i18n) as it:
+            for entry in it:
+                if entry.is_dir():
+                    has_subdirs = True
+                    # 查找default文件夹（忽略大小写）
+                    if entry.name.lower() == 'default':
+                        default_folder = entry.path
         
         if has_subdirs and default_folder:
             # 有子文件夹的情况：复制Default文件夹中的所有JSON文件
@@ -504,14 +734,14 @@ class OneClickUpdateProcessor:
                         src_file = os.path.join(root, file)
                         rel_path = os.path.relpath(src_file, default_folder)
                         # 添加mod名称前缀避免冲突
-                        dest_file = os.path.join(dest_en_folder, f"{mod_name}_{rel_path}")
+                        dest_file = os.path.join(dest_en_folder, prefix + rel_path)
                         os.makedirs(os.path.dirname(dest_file), exist_ok=True)
                         shutil.copy2(src_file, dest_file)
         else:
             # 只有文件的情况：只复制default.json
             default_file = os.path.join(source_i18n, 'default.json')
             if os.path.exists(default_file):
-                dest_file = os.path.join(dest_en_folder, f"{mod_name}_default.json")
+                dest_file = os.path.join(dest_en_folder, prefix + "default.json")
                 shutil.copy2(default_file, dest_file)
     
     def _collect_chinese_files(self, source_i18n: str, dest_zh_folder: str, mod_name: str, force_prefix: str = None):
@@ -531,13 +761,17 @@ class OneClickUpdateProcessor:
         has_subdirs = False
         zh_folder = None
         
-        for item in os.listdir(source_i18n):
-            item_path = os.path.join(source_i18n, item)
-            if os.path.isdir(item_path):
-                has_subdirs = True
-                # 查找zh文件夹（忽略大小写）
-                if item.lower() in ['zh', 'chinese']:
-                    zh_folder = item_path
+        # 同时记录文件，后面查找其他中文文件时不必再次列目录
+        json_files = []
+        with os.scandir(source_i18n) as it:
+            for entry in it:
+                if entry.is_dir():
+                    has_subdirs = True
+                    # 查找zh文件夹（忽略大小写）
+                    if entry.name.lower() in ['zh', 'chinese']:
+                        zh_folder = entry.path
+                elif entry.name.endswith('.json'):
+                    json_files.append(entry)
         
         # 确定使用的前缀
         prefix = force_prefix if force_prefix else mod_name
@@ -565,9 +799,10 @@ class OneClickUpdateProcessor:
             # 首先查找标准的zh.json等文件
             chinese_files = ['zh.json', 'chinese.json', 'zh-CN.json']
             found_zh_file = False
+            existing_files = {entry.name: entry.path for entry in json_files}
             for file_name in chinese_files:
-                file_path = os.path.join(source_i18n, file_name)
-                if os.path.exists(file_path):
+                file_path = existing_files.get(file_name)
+                if file_path:
                     # zh.json对应default.json，所以改为prefix_default.json
                     dest_file = os.path.join(dest_zh_folder, f"{prefix}_default.json")
                     shutil.copy2(file_path, dest_file)
@@ -575,19 +810,19 @@ class OneClickUpdateProcessor:
                     break
             
             # 查找其他可能的中文文件（如mod_zh.json等）
-            for file_name in os.listdir(source_i18n):
-                if file_name.endswith('.json') and file_name not in chinese_files:
+            for entry in json_files:
+                file_name = entry.name
+                if file_name not in chinese_files:
                     # 检查是否可能是中文文件（包含zh、chinese等关键词）
-                    if 'zh' in file_name.lower() or 'chinese' in file_name.lower() or 'cn' in file_name.lower():
-                        file_path = os.path.join(source_i18n, file_name)
+                    if _ZH_NAME_RE.search(file_name):
+                        file_path = entry.path
                         dest_file = os.path.join(dest_zh_folder, f"{prefix}_{file_name}")
                         shutil.copy2(file_path, dest_file)
-                        signal_bus.log_message.emit("DEBUG", f"复制中文文件: {file_name} -> {os.path.basename(dest_file)}", {})
+                        self._log("DEBUG", f"复制中文文件: {file_name} -> {os.path.basename(dest_file)}")
 
-    def _extract_manifest_fields(self, manifest_path: str) -> Dict[str, str]:
-        """从manifest.json提取需要翻译的字段"""
+    def _extract_manifest_fields(self, manifest_data: Dict) -> Dict[str, str]:
+        """从已解析的manifest.json数据中提取需要翻译的字段"""
         try:
-            manifest_data = file_tool.read_json_file(manifest_path)
             translation_data = {}
             
             # 提取Name字段
@@ -607,15 +842,15 @@ class OneClickUpdateProcessor:
         """将翻译结果回填到manifest.json"""
         try:
             manifest_path = os.path.join(output_dir, 'manifest.json')
-            signal_bus.log_message.emit("DEBUG", f"准备回填manifest: {manifest_path}", {})
+            self._log("DEBUG", f"准备回填manifest: {manifest_path}")
             
             if not os.path.exists(manifest_path):
-                signal_bus.log_message.emit("WARNING", f"manifest文件不存在: {manifest_path}", {})
+                self._log("WARNING", f"manifest文件不存在: {manifest_path}")
                 return
             
             # 读取现有的manifest
             manifest = file_tool.read_json_file(manifest_path)
-            signal_bus.log_message.emit("DEBUG", f"读取manifest成功，包含字段: {list(manifest.keys()) if isinstance(manifest, dict) else '非字典格式'}", {})
+            self._log("DEBUG", f"读取manifest成功，包含字段: {list(manifest.keys()) if isinstance(manifest, dict) else '非字典格式'}")
             
             # 查找属于当前mod的翻译
             updated = False
@@ -624,7 +859,8 @@ class OneClickUpdateProcessor:
             for key, info in manifest_data.items():
                 if info['mod_name'] == mod_name:
                     field_name = info['key']
-                    signal_bus.log_message.emit("DEBUG", f"处理字段: {field_name}, key={key}", {})
+                    if _DEBUG_ENABLED:
+                        self._log("DEBUG", f"处理字段: {field_name}, key={key}")
                     
                     if field_name in ['Name', 'Description']:
                         if key in translated_data:
@@ -634,19 +870,20 @@ class OneClickUpdateProcessor:
                             manifest[field_name] = translated_value
                             updated = True
                             updated_fields.append(f"{field_name}: '{old_value}' -> '{translated_value}'")
-                            signal_bus.log_message.emit("DEBUG", f"更新字段 {field_name}: {old_value} -> {translated_value}", {})
+                            if _DEBUG_ENABLED:
+                                self._log("DEBUG", f"更新字段 {field_name}: {old_value} -> {translated_value}")
                         else:
-                            signal_bus.log_message.emit("WARNING", f"未找到翻译结果: key={key}", {})
+                            self._log("WARNING", f"未找到翻译结果: key={key}")
             
             # 如果有更新，保存文件
             if updated:
                 file_tool.save_json_file(manifest, manifest_path)
-                signal_bus.log_message.emit("SUCCESS", f"manifest翻译回填完成: {mod_name}, 更新字段: {', '.join(updated_fields)}", {})
+                self._log("SUCCESS", f"manifest翻译回填完成: {mod_name}, 更新字段: {', '.join(updated_fields)}")
             else:
-                signal_bus.log_message.emit("DEBUG", f"manifest没有需要更新的字段: {mod_name}", {})
+                self._log("DEBUG", f"manifest没有需要更新的字段: {mod_name}")
             
         except Exception as e:
-            signal_bus.log_message.emit("ERROR", f"回填manifest翻译失败: {str(e)}", {})
+            self._log("ERROR", f"回填manifest翻译失败: {str(e)}")
     
     def _backfill_config_translation(self, config_data: Dict, translated_data: Dict, mod_name: str, output_dir: str):
         """将配置菜单翻译结果保存到zh.json或新文件"""
@@ -654,9 +891,9 @@ class OneClickUpdateProcessor:
             i18n_folder = os.path.join(output_dir, 'i18n')
             zh_file = os.path.join(i18n_folder, 'zh.json')
             
-            signal_bus.log_message.emit("DEBUG", f"准备处理配置菜单翻译: {mod_name}", {})
-            signal_bus.log_message.emit("DEBUG", f"config_data中有 {len(config_data)} 项", {})
-            signal_bus.log_message.emit("DEBUG", f"translated_data中有 {len(translated_data)} 项", {})
+            self._log("DEBUG", f"准备处理配置菜单翻译: {mod_name}")
+            self._log("DEBUG", f"config_data中有 {len(config_data)} 项")
+            self._log("DEBUG", f"translated_data中有 {len(translated_data)} 项")
             
             # 收集属于当前mod的翻译结果
             mod_translations = {}
@@ -665,12 +902,13 @@ class OneClickUpdateProcessor:
                     # 获取原始键名
                     original_key = info['key']
                     mod_translations[original_key] = translated_data[key]
-                    signal_bus.log_message.emit("DEBUG", f"配置菜单翻译: {original_key} = {translated_data[key]}", {})
+                    if _DEBUG_ENABLED:
+                        self._log("DEBUG", f"配置菜单翻译: {original_key} = {translated_data[key]}")
             
-            signal_bus.log_message.emit("DEBUG", f"找到 {len(mod_translations)} 项配置菜单翻译", {})
+            self._log("DEBUG", f"找到 {len(mod_translations)} 项配置菜单翻译")
             
             if not mod_translations:
-                signal_bus.log_message.emit("DEBUG", f"没有找到 {mod_name} 的配置菜单翻译", {})
+                self._log("DEBUG", f"没有找到 {mod_name} 的配置菜单翻译")
                 return
             
             # 根据i18n结构决定保存方式
@@ -678,30 +916,33 @@ class OneClickUpdateProcessor:
                 # 文件夹形式：保存为配置菜单翻译.json
                 config_file = os.path.join(i18n_folder, '配置菜单翻译.json')
                 self._save_config_translation(mod_translations, config_file, is_new_file=True)
-                signal_bus.log_message.emit("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，保存到配置菜单翻译.json", {})
+                self._log("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，保存到配置菜单翻译.json")
             else:
                 # 文件形式：使用已有的追加逻辑
                 if os.path.exists(zh_file):
                     self._save_config_translation(mod_translations, zh_file, is_new_file=False)
-                    signal_bus.log_message.emit("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，追加到zh.json", {})
+                    self._log("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，追加到zh.json")
                 else:
                     # zh.json不存在，创建新文件
                     self._save_config_translation(mod_translations, zh_file, is_new_file=True)
-                    signal_bus.log_message.emit("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，创建zh.json", {})
+                    self._log("SUCCESS", f"配置菜单翻译完成：{len(mod_translations)} 项，创建zh.json")
             
         except Exception as e:
-            signal_bus.log_message.emit("ERROR", f"保存配置菜单翻译失败: {str(e)}", {})
+            self._log("ERROR", f"保存配置菜单翻译失败: {str(e)}")
     
     def _perform_quality_check(self, output_folder: str):
         """执行质量检查"""
         try:
             signal_bus.log_message.emit("INFO", "开始质量检查...", {})
-            signal_bus.log_message.emit("DEBUG", f"output_folder参数: {output_folder}", {})
+            _dbg(f"output_folder参数: {output_folder}")
             
             # 获取项目的en文件夹路径
-            en_folder = self.project_manager.get_folder_path('en')
+            en_folder = self._get_folder_path('en')
             # 使用传入的output_folder参数，而不是重新获取
             output_folder_path = output_folder
+            # 两个文件夹在开头确保存在一次，后面不再检查
+            for folder in (en_folder, output_folder_path):
+                os.makedirs(folder, exist_ok=True)
             
             # 先收集en文件夹中的英文文件（不包括xxx_content.json和xxx_manifest.json）
             merged_en_data = {}
@@ -709,58 +950,48 @@ class OneClickUpdateProcessor:
             mod_mapping = {}  # 记录键名到mod和文件的映射
             mod_name_mapping = {}  # 记录英文文件名到mod文件夹名的映射
             
-            # 先收集output文件夹中所有的mod文件夹名称
-            all_mod_names = set()
-            if os.path.exists(output_folder_path):
-                for item in os.listdir(output_folder_path):
-                    mod_path = os.path.join(output_folder_path, item)
-                    if os.path.isdir(mod_path):
-                        all_mod_names.add(item)
+            # 先收集output文件夹中所有的mod文件夹名称（后面收集中文文件时复用，不再重复列目录）
+            with os.scandir(output_folder_path) as it:
+                mod_folders = [entry.name for entry in it if entry.is_dir()]
+            all_mod_names = set(mod_folders)
             
             # 1. 收集项目的en文件夹中的英文文件（不包括xxx_content.json和xxx_manifest.json）
-            if os.path.exists(en_folder):
-                en_files = [f for f in os.listdir(en_folder) if f.endswith('.json') and not f.endswith('_content.json') and not f.endswith('_manifest.json')]
-                signal_bus.log_message.emit("INFO", f"en文件夹中找到 {len(en_files)} 个英文文件", {})
+            en_files = [f for f in os.listdir(en_folder) if f.endswith('.json') and not f.endswith('_content.json') and not f.endswith('_manifest.json')]
+            signal_bus.log_message.emit("INFO", f"en文件夹中找到 {len(en_files)} 个英文文件", {})
                 
-                for filename in en_files:
-                    file_path = os.path.join(en_folder, filename)
-                    try:
-                        file_data = file_tool.read_json_file(file_path)
-                        signal_bus.log_message.emit("DEBUG", f"读取英文文件 {filename} 成功，包含 {len(file_data)} 项", {})
+            # 小写mod名 -> 实际mod名，只计算一次，供按文件名模糊匹配
+            mod_names_lower = {mod.lower(): mod for mod in all_mod_names}
+                
+            # 并发读取所有英文文件，结果在当前线程按顺序合并
+            en_results = _read_json_files([os.path.join(en_folder, f) for f in en_files])
+            for filename, (file_data, error) in zip(en_files, en_results):
+                try:
+                    if error is not None:
+                        raise error
+                    _dbg(f"读取英文文件 {filename} 成功，包含 {len(file_data)} 项")
                         
-                        # 生成唯一的键名
-                        import hashlib
-                        for key, value in file_data.items():
-                            # 从文件名提取mod文件夹名（去除前缀和后缀）
-                            mod_name = filename
-                            # 如果文件名有下划线前缀，去除前缀
-                            if '_' in filename:
-                                parts = filename.split('_')
-                                if len(parts) > 1:
-                                    mod_name = parts[0]
-                            
-                            # 检查提取的mod_name是否在output文件夹的mod列表中
-                            actual_mod_name = mod_name
-                            if mod_name not in all_mod_names:
-                                # 如果不在，尝试找到匹配的mod名称（去除某些后缀等）
-                                for mod in all_mod_names:
-                                    if mod.lower().startswith(mod_name.lower()) or mod_name.lower().startswith(mod.lower()):
-                                        actual_mod_name = mod
-                                        break
-                            
-                            # 使用实际的mod文件夹名_键名的哈希值
-                            hash_input = f"{actual_mod_name}_{key}"
-                            unique_key = hashlib.md5(hash_input.encode()).hexdigest()
+                    # mod文件夹名只取决于文件名，每个文件解析一次
+                    actual_mod_name = self._resolve_quality_check_mod(filename, all_mod_names, mod_names_lower)
+                        
+                    # 生成唯一的键名
+                    for key, value in file_data.items():
+                        # 使用实际的mod文件夹名/键名作为唯一键
+                        unique_key = _quality_check_key(actual_mod_name, key)
                             
-                            merged_en_data[unique_key] = value
+                        merged_en_data[unique_key] = value
+                        # 同一个(mod, 键)重复出现时复用已有映射，只更新文件名
+                        mapping = mod_mapping.get(unique_key)
+                        if mapping is None:
                             mod_mapping[unique_key] = {
                                 'mod_name': actual_mod_name,
                                 'filename': filename,
                                 'original_key': key
                             }
-                    except Exception as e:
-                        signal_bus.log_message.emit("ERROR", f"读取英文文件 {filename} 失败: {str(e)}", {})
-                        continue
+                        elif mapping['filename'] != filename:
+                            mapping['filename'] = filename
+                except Exception as e:
+                    signal_bus.log_message.emit("ERROR", f"读取英文文件 {filename} 失败: {str(e)}", {})
+                    continue
 
             
             # 保留en文件夹内容，不再清空
@@ -769,98 +1000,71 @@ class OneClickUpdateProcessor:
             #     shutil.rmtree(en_folder)
             # os.makedirs(en_folder, exist_ok=True)
             
-            # 确保output文件夹存在
-            os.makedirs(output_folder_path, exist_ok=True)
-            
             # 保存到项目文件夹
             en_file = os.path.join(en_folder, '质量检查.json')
             zh_file = os.path.join(output_folder_path, '质量检查.json')
 
             
             # 2. 收集output各个mod文件夹中的中文文件
-            if os.path.exists(output_folder_path):
-                mod_folders = [item for item in os.listdir(output_folder_path) if os.path.isdir(os.path.join(output_folder_path, item))]
-                signal_bus.log_message.emit("INFO", f"output文件夹中有 {len(mod_folders)} 个mod文件夹: {mod_folders}", {})
+            signal_bus.log_message.emit("INFO", f"output文件夹中有 {len(mod_folders)} 个mod文件夹: {mod_folders}", {})
                 
-                for item in mod_folders:
-                    mod_path = os.path.join(output_folder_path, item)
-                    # 查找mod文件夹中的i18n文件夹
-                    i18n_path = os.path.join(mod_path, 'i18n')
-                    
-                    if not os.path.exists(i18n_path):
-                        signal_bus.log_message.emit("DEBUG", f"mod {item} 没有i18n文件夹", {})
-                        continue
+            # 先扫描目录结构，记录要读取的中文文件：(mod文件夹名, 记录的文件名, 文件路径)
+            zh_tasks = []
+            for item in mod_folders:
+                # 查找mod文件夹中的i18n文件夹，一次遍历同时找出zh.json和zh文件夹
+                i18n_path = os.path.join(output_folder_path, item, 'i18n')
+                try:
+                    zh_file_path, zh_folder = self._scan_zh_sources(i18n_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    _dbg(f"mod {item} 没有i18n文件夹")
+                    continue
                     
-                    signal_bus.log_message.emit("DEBUG", f"检查mod {item} 的i18n文件夹", {})
+                _dbg(f"检查mod {item} 的i18n文件夹")
                     
-                    # 检查是否有zh.json文件
-                    zh_file_path = os.path.join(i18n_path, 'zh.json')
-                    signal_bus.log_message.emit("DEBUG", f"检查zh.json是否存在: {zh_file_path}", {})
-                    if os.path.exists(zh_file_path):
-                        # 处理zh.json文件
-                        try:
-                            zh_data = file_tool.read_json_file(zh_file_path)
-                            signal_bus.log_message.emit("DEBUG", f"zh.json包含 {len(zh_data)} 项", {})
-                        except Exception as e:
-                            signal_bus.log_message.emit("ERROR", f"读取zh.json失败: {str(e)}", {})
-                            continue
-                        for key, value in zh_data.items():
-                            # 使用mod文件夹名_键名的哈希值
-                            import hashlib
-                            hash_input = f"{item}_{key}"
-                            unique_key = hashlib.md5(hash_input.encode()).hexdigest()
-
-                            merged_zh_data[unique_key] = value
-                            mod_mapping[unique_key] = {
-                                'mod_name': item,
-                                'filename': 'zh.json',
-                                'original_key': key
-                            }
+                if zh_file_path:
+                    zh_tasks.append((item, 'zh.json', zh_file_path))
+                elif zh_folder:
+                    # 处理zh文件夹中的所有json文件
+                    with os.scandir(zh_folder) as it:
+                        for entry in it:
+                            if entry.name.endswith('.json'):
+                                zh_tasks.append((item, f"zh/{entry.name}", entry.path))
+                else:
+                    _dbg(f"mod {item} 没有zh.json或zh文件夹")
+                
+            # 并发读取，结果在当前线程按扫描顺序合并
+            zh_results = _read_json_files([task[2] for task in zh_tasks])
+            for (item, filename, file_path), (file_data, error) in zip(zh_tasks, zh_results):
+                if error is not None:
+                    if filename == 'zh.json':
+                        signal_bus.log_message.emit("ERROR", f"读取zh.json失败: {str(error)}", {})
                     else:
-                        # 检查是否有zh文件夹（不区分大小写）
-                        zh_folder = None
-                        for subitem in os.listdir(i18n_path):
-                            subitem_path = os.path.join(i18n_path, subitem)
-                            if os.path.isdir(subitem_path) and subitem.lower() == 'zh':
-                                zh_folder = subitem_path
-                                break
-
-                        if zh_folder:
-                            # 处理zh文件夹中的所有json文件
-                            for filename in os.listdir(zh_folder):
-                                if not filename.endswith('.json'):
-                                    continue
-                                file_path = os.path.join(zh_folder, filename)
-                                try:
-                                    file_data = file_tool.read_json_file(file_path)
-                                except Exception as e:
-                                    signal_bus.log_message.emit("ERROR", f"读取文件 {filename} 失败: {str(e)}", {})
-                                    continue
+                        signal_bus.log_message.emit("ERROR", f"读取文件 {os.path.basename(file_path)} 失败: {str(error)}", {})
+                    continue
+                if filename == 'zh.json':
+                    _dbg(f"zh.json包含 {len(file_data)} 项")
 
-                                for key, value in file_data.items():
-                                    # 使用mod文件夹名_键名的哈希值
-                                    import hashlib
-                                    hash_input = f"{item}_{key}"
-                                    unique_key = hashlib.md5(hash_input.encode()).hexdigest()
+                for key, value in file_data.items():
+                    # 使用mod文件夹名/键名作为唯一键
+                    unique_key = _quality_check_key(item, key)
 
-                                    merged_zh_data[unique_key] = value
-                                    mod_mapping[unique_key] = {
-                                        'mod_name': item,
-                                        'filename': f"zh/{filename}",
-                                        'original_key': key
-                                    }
-                        else:
-                            signal_bus.log_message.emit("DEBUG", f"mod {item} 没有zh.json或zh文件夹", {})
+                    merged_zh_data[unique_key] = value
+                    # 英文侧已记录的键只需改成中文文件名（回填按中文文件写入）
+                    mapping = mod_mapping.get(unique_key)
+                    if mapping is None:
+                        mod_mapping[unique_key] = {
+                            'mod_name': item,
+                            'filename': filename,
+                            'original_key': key
+                        }
+                    elif mapping['filename'] != filename:
+                        mapping['filename'] = filename
             
             if not merged_zh_data:
                 signal_bus.log_message.emit("WARNING", "没有找到翻译文件，跳过质量检查", {})
                 return
             
             # 保存合并后的文件到项目文件夹
-            # 确保文件夹存在
-            os.makedirs(en_folder, exist_ok=True)
-            os.makedirs(output_folder_path, exist_ok=True)
-            
             # 检查是否收集到数据
             signal_bus.log_message.emit("INFO", f"收集到 {len(merged_en_data)} 项英文数据，{len(merged_zh_data)} 项中文数据", {})
             
@@ -875,27 +1079,27 @@ class OneClickUpdateProcessor:
                     'data': merged_en_data,
                     'mod_mapping': mod_mapping
                 }
-                file_tool.save_json_file(file_data, en_file)
+                _fast_dump(file_data, en_file)
                 signal_bus.log_message.emit("INFO", f"保存英文合并文件成功: {en_file}，包含 {len(merged_en_data)} 项", {})
             except Exception as e:
                 signal_bus.log_message.emit("ERROR", f"保存英文合并文件失败: {str(e)}", {})
                 return
             
             try:
-                # 将mod_mapping信息也保存到文件中
+                # mod_mapping 已随英文文件保存（质量检查只从英文文件读取），中文文件只保存数据
                 file_data = {
-                    'data': merged_zh_data,
-                    'mod_mapping': mod_mapping
+                    'data': merged_zh_data
                 }
-                file_tool.save_json_file(file_data, zh_file)
+                _fast_dump(file_data, zh_file)
                 signal_bus.log_message.emit("INFO", f"保存中文合并文件成功: {zh_file}，包含 {len(merged_zh_data)} 项", {})
 
-                # 列出output文件夹的所有内容
-                try:
-                    output_files = os.listdir(output_folder_path)
-                    signal_bus.log_message.emit("DEBUG", f"output文件夹内容: {output_files}", {})
-                except Exception as e:
-                    signal_bus.log_message.emit("ERROR", f"列出output文件夹内容失败: {str(e)}", {})
+                # 列出output文件夹的所有内容（仅调试时，避免多余的目录读取）
+                if _DEBUG_ENABLED:
+                    try:
+                        output_files = os.listdir(output_folder_path)
+                        _dbg(f"output文件夹内容: {output_files}")
+                    except Exception as e:
+                        signal_bus.log_message.emit("ERROR", f"列出output文件夹内容失败: {str(e)}", {})
             except Exception as e:
                 signal_bus.log_message.emit("ERROR", f"保存中文合并文件失败: {str(e)}", {})
                 return
@@ -911,6 +1115,42 @@ class OneClickUpdateProcessor:
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"质量检查失败: {str(e)}", {})
     
+    @staticmethod
+    def _scan_zh_sources(i18n_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """遍历一次i18n文件夹，返回 (zh.json路径, zh文件夹路径)，都不区分大小写；i18n文件夹不存在时抛出异常"""
+        zh_file_path = None
+        zh_folder = None
+        with os.scandir(i18n_path) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name == 'zh.json' and entry.is_file():
+                    # zh.json优先，找到后无需再看zh文件夹
+                    zh_file_path = entry.path
+                    break
+                if name == 'zh' and zh_folder is None and entry.is_dir():
+                    zh_folder = entry.path
+        return zh_file_path, zh_folder
+
+    @staticmethod
+    def _resolve_quality_check_mod(filename: str, all_mod_names: set, mod_names_lower: Dict[str, str]) -> str:
+        """从en文件名解析所属的output mod文件夹名"""
+        # 从文件名提取mod文件夹名：有下划线前缀时取第一段
+        mod_name = filename.split('_', 1)[0] if '_' in filename else filename
+        
+        # 检查提取的mod_name是否在output文件夹的mod列表中
+        if mod_name in all_mod_names:
+            return mod_name
+        # 忽略大小写完全相同时直接命中
+        mod_name_lower = mod_name.lower()
+        mod = mod_names_lower.get(mod_name_lower)
+        if mod is not None:
+            return mod
+        # 如果不在，尝试找到匹配的mod名称（去除某些后缀等）
+        for mod_lower, mod in mod_names_lower.items():
+            if mod_lower.startswith(mod_name_lower) or mod_name_lower.startswith(mod_lower):
+                return mod
+        return mod_name
+    
     def _show_quality_check_dialog(self, en_file, zh_file, output_folder, mod_mapping):
         """显示独立的质量检查窗口"""
         try:
@@ -921,9 +1161,8 @@ class OneClickUpdateProcessor:
             self._quality_check_output_folder = str(output_folder) if output_folder else None
             self._quality_check_mod_mapping = mod_mapping
             
-            # 使用QTimer延迟创建窗口，确保不在信号处理过程中创建
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(100, self._delayed_create_quality_check_window)
+            # 调用链已由 trigger_quality_check 的定时器推迟到事件循环中，不在信号处理过程中，直接创建窗口
+            self._delayed_create_quality_check_window()
             
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"准备质量检查窗口失败: {str(e)}", {})
@@ -938,13 +1177,10 @@ class OneClickUpdateProcessor:
     def _create_quality_check_window(self):
         """实际创建质量检查窗口"""
         try:
-            from PySide6.QtWidgets import QDialog, QVBoxLayout, QApplication, QWidget
-            from ui.quality_check_widget import QualityCheckWidget
-            from ui.widgets import BackgroundWidget
-            from ui.custom_title_bar import CustomTitleBar
+            qc_ui = _quality_check_ui()
             
             # 创建对话框
-            dialog = QDialog()
+            dialog = qc_ui.QDialog()
             dialog.setWindowTitle("质量检查 - 一键更新")
             dialog.setMinimumSize(800, 600)
             # 设置为非模态对话框
@@ -955,46 +1191,45 @@ class OneClickUpdateProcessor:
             dialog.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
             
             # 创建主布局（透明）
-            main_layout = QVBoxLayout(dialog)
+            main_layout = qc_ui.QVBoxLayout(dialog)
             main_layout.setContentsMargins(0, 0, 0, 0)
             
             # 创建内容区域
-            content_widget = QWidget()
-            content_layout = QVBoxLayout(content_widget)
+            content_widget = qc_ui.QWidget()
+            content_layout = qc_ui.QVBoxLayout(content_widget)
             content_layout.setContentsMargins(0, 0, 0, 0)
             
             # 创建带背景的中心widget
             # 获取主窗口的背景图片
             main_window = None
-            for widget in QApplication.topLevelWidgets():
+            for widget in qc_ui.QApplication.topLevelWidgets():
                 if hasattr(widget, 'background_pixmap'):
                     main_window = widget
                     break
             
             # 创建背景widget
-            background_widget = BackgroundWidget(
+            background_widget = qc_ui.BackgroundWidget(
                 main_window.background_pixmap if main_window else None, 
                 config.theme
             )
             
             # 创建布局
-            layout = QVBoxLayout(background_widget)
+            layout = qc_ui.QVBoxLayout(background_widget)
             layout.setContentsMargins(0, 0, 0, 0)
             
             # 添加自定义标题栏（在背景内）
-            title_bar = CustomTitleBar(dialog, show_theme_toggle=False)
+            title_bar = qc_ui.CustomTitleBar(dialog, show_theme_toggle=False)
             layout.addWidget(title_bar)
             
             # 创建质量检查组件
-            quality_widget = QualityCheckWidget()
+            quality_widget = qc_ui.QualityCheckWidget()
             
             # 保存output文件夹路径到组件
             quality_widget.output_folder = self._quality_check_output_folder
             quality_widget.mod_mapping = self._quality_check_mod_mapping
             
-            # 延迟启动质量检查，传递必要的参数
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(300, lambda: quality_widget.set_files_for_check(
+            # 窗口显示后的下一轮事件循环再启动质量检查，传递必要的参数
+            qc_ui.QTimer.singleShot(0, lambda: quality_widget.set_files_for_check(
                 self._quality_check_en_file, 
                 self._quality_check_zh_file
             ))
@@ -1020,8 +1255,7 @@ class OneClickUpdateProcessor:
             dialog.finished.connect(self._on_quality_check_dialog_closed)
             
             # 应用主题样式
-            from ui.styles import get_main_window_style
-            dialog.setStyleSheet(get_main_window_style(config.theme))
+            dialog.setStyleSheet(qc_ui.get_main_window_style(config.theme))
             
             # 显示非模态对话框
             dialog.show()
@@ -1054,34 +1288,26 @@ class OneClickUpdateProcessor:
     def _cleanup_temp_files(self, output_folder_path, cleanup_quality_check=False):
         """清理临时文件"""
         try:
-            import glob
-            # 清理所有带下划线的json文件
-            temp_files = glob.glob(os.path.join(output_folder_path, "*_*.json"))
-            for temp_file in temp_files:
+            # 一次遍历output文件夹：清理所有带下划线的json文件（含temp_translation.json），
+            # 质量检查.json 只在需要时清理
+            with os.scandir(output_folder_path) as it:
+                temp_entries = [
+                    entry for entry in it
+                    if entry.name.endswith('.json') and not entry.name.startswith('.')
+                    and ('_' in entry.name
+                         or (cleanup_quality_check and entry.name == "质量检查.json"))
+                    and not entry.is_dir()
+                ]
+            for entry in temp_entries:
                 try:
-                    # 根据参数决定是否跳过质量检查文件
-                    if not cleanup_quality_check and os.path.basename(temp_file) == "质量检查.json":
-                        continue
-                    os.remove(temp_file)
-                    signal_bus.log_message.emit("DEBUG", f"清理临时文件: {os.path.basename(temp_file)}", {})
+                    os.remove(entry.path)
+                    _dbg(f"清理临时文件: {entry.name}")
                 except Exception as e:
-                    signal_bus.log_message.emit("WARNING", f"清理文件失败: {temp_file}, 错误: {str(e)}", {})
-            
-            # 清理temp_translation.json
-            temp_file = os.path.join(output_folder_path, "temp_translation.json")
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                    signal_bus.log_message.emit("DEBUG", f"清理临时文件: temp_translation.json", {})
-                except Exception as e:
-                    signal_bus.log_message.emit("WARNING", f"清理文件失败: {temp_file}, 错误: {str(e)}", {})
-            
-            # 清理质量检查.json文件（如果需要）
-            if cleanup_quality_check:
-                quality_check_file = os.path.join(output_folder_path, "质量检查.json")
-                if os.path.exists(quality_check_file):
-                    os.remove(quality_check_file)
+                    signal_bus.log_message.emit("WARNING", f"清理文件失败: {entry.path}, 错误: {str(e)}", {})
 
+        except FileNotFoundError:
+            # output文件夹不存在时没有需要清理的文件
+            pass
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"清理临时文件失败: {str(e)}", {})
     
@@ -1101,7 +1327,7 @@ class OneClickUpdateProcessor:
     def _backfill_quality_check_results(self, edited_file, output_folder, mod_mapping):
         """将质量检查编辑后的结果回填到各个mod文件夹"""
         try:
-            signal_bus.log_message.emit("DEBUG", f"开始回填质量检查结果: {edited_file}", {})
+            _dbg(f"开始回填质量检查结果: {edited_file}")
             
             if not edited_file or not os.path.exists(edited_file):
                 signal_bus.log_message.emit("WARNING", "编辑文件不存在，跳过回填", {})
@@ -1109,7 +1335,7 @@ class OneClickUpdateProcessor:
             
             # 读取编辑后的数据
             edited_data = file_tool.read_json_file(edited_file)
-            signal_bus.log_message.emit("DEBUG", f"读取到 {len(edited_data)} 项编辑数据", {})
+            _dbg(f"读取到 {len(edited_data)} 项编辑数据")
             
             # 按mod和文件分组
             mod_file_data = {}
@@ -1120,27 +1346,27 @@ class OneClickUpdateProcessor:
                     filename = mapping['filename']
                     original_key = mapping['original_key']
                     
-                    if mod_name not in mod_file_data:
-                        mod_file_data[mod_name] = {}
-                    if filename not in mod_file_data[mod_name]:
-                        mod_file_data[mod_name][filename] = {}
-                    mod_file_data[mod_name][filename][original_key] = value
+                    mod_file_data.setdefault(mod_name, {}).setdefault(filename, {})[original_key] = value
             
-            # 回填到各个mod文件夹
+            # 回填到各个mod文件夹：每个目标文件只读写一次
+            targets = []
             for mod_name, file_data in mod_file_data.items():
-                mod_path = os.path.join(output_folder, mod_name)
-                i18n_path = os.path.join(mod_path, 'i18n')
-                
+                i18n_path = os.path.join(output_folder, mod_name, 'i18n')
                 for filename, data in file_data.items():
-                    # 确定目标文件名
-                    if filename == 'zh.json':
-                        target_file = os.path.join(i18n_path, 'zh.json')
-                    else:
-                        target_file = os.path.join(i18n_path, filename)
-                    
+                    target_file = os.path.join(i18n_path, filename)
                     if os.path.exists(target_file):
-                        file_tool.save_json_file(data, target_file)
-                        signal_bus.log_message.emit("SUCCESS", f"回填质量检查结果: {mod_name}/{filename}, {len(data)} 项", {})
+                        targets.append((mod_name, filename, target_file, data))
+            
+            def backfill(task):
+                mod_name, filename, target_file, data = task
+                # 以目标文件自身为原文件合并：只替换编辑过的键，其余内容和格式保持不变
+                if file_tool.save_json_file(data, target_file, target_file):
+                    signal_bus.log_message.emit("SUCCESS", f"回填质量检查结果: {mod_name}/{filename}, {len(data)} 项", {})
+            
+            # 各目标文件互不相关，并发写入
+            if targets:
+                with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                    list(executor.map(backfill, targets))
             
         # 注意：不清理文件，让质量检查组件自己处理
             
@@ -1160,13 +1386,12 @@ class OneClickUpdateProcessor:
                 self._update_existing_quality_check()
             else:
                 # 创建新的质量检查窗口
-                output_folder = self.project_manager.get_folder_path('output')
-                signal_bus.log_message.emit("DEBUG", f"output_folder: {output_folder}", {})
+                output_folder = self._get_folder_path('output')
+                _dbg(f"output_folder: {output_folder}")
                 # 保存为实例变量，避免通过闭包传递
                 self._quality_check_output_folder = output_folder
-                # 使用QTimer延迟执行，避免在信号处理过程中直接创建窗口
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(5000, self._delayed_perform_quality_check)
+                # 使用QTimer推迟到下一轮事件循环执行，避免在信号处理过程中直接创建窗口
+                _quality_check_ui().QTimer.singleShot(0, self._delayed_perform_quality_check)
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"触发质量检查失败: {str(e)}", {})
     
@@ -1185,13 +1410,14 @@ class OneClickUpdateProcessor:
                 signal_bus.log_message.emit("WARNING", "质量检查窗口没有问题项", {})
                 return
             
-            signal_bus.log_message.emit("DEBUG", f"质量检查窗口有 {len(quality_fixes)} 个问题项", {})
+            _dbg(f"质量检查窗口有 {len(quality_fixes)} 个问题项")
             
             # 只针对表格中的问题项查找对应的翻译
             translation_results = {}
-            output_folder = self.project_manager.get_folder_path('output')
+            output_folder = self._get_folder_path('output')
             
-            # 遍历每个问题项，查找其最新的翻译
+            # 按来源文件分组问题项：(mod名, 文件名) -> [(合并键, 原始键)]，每个文件只读取一次
+            keys_by_file: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
             for key, fix_data in quality_fixes.items():
                 # fix_data应该包含原始文件信息
                 mod_name = fix_data.get('mod_name', '')
@@ -1200,43 +1426,50 @@ class OneClickUpdateProcessor:
                 
                 if not mod_name or not original_key:
                     continue
-                
-                # 构建mod路径
-                mod_path = os.path.join(output_folder, mod_name)
-                i18n_path = os.path.join(mod_path, 'i18n')
-                
-                if not os.path.exists(i18n_path):
-                    continue
+                keys_by_file.setdefault((mod_name, filename), []).append((key, original_key))
+            
+            # 解析每个来源文件的路径：(显示用文件名, 文件路径, 问题项)
+            sources = []
+            for (mod_name, filename), keys in keys_by_file.items():
+                i18n_path = os.path.join(output_folder, mod_name, 'i18n')
                 
                 # 根据文件类型查找翻译
                 if filename == 'zh.json':
-                    zh_file_path = os.path.join(i18n_path, 'zh.json')
-                    if os.path.exists(zh_file_path):
-                        try:
-                            zh_data = file_tool.read_json_file(zh_file_path)
-                            if original_key in zh_data:
-                                translation_results[key] = zh_data[original_key]
-                        except Exception as e:
-                            signal_bus.log_message.emit("ERROR", f"读取翻译文件失败: {str(e)}", {})
+                    file_path = os.path.join(i18n_path, 'zh.json')
+                    display_name = None
                 elif filename.startswith('zh/'):
-                    # ZH文件夹中的文件
+                    # ZH文件夹中的文件（文件夹名不区分大小写）
                     zh_filename = filename[3:]  # 去掉 'zh/' 前缀
                     zh_folder = None
-                    for subitem in os.listdir(i18n_path):
-                        subitem_path = os.path.join(i18n_path, subitem)
-                        if os.path.isdir(subitem_path) and subitem.lower() == 'zh':
-                            zh_folder = subitem_path
-                            break
-                    
-                    if zh_folder:
-                        file_path = os.path.join(zh_folder, zh_filename)
-                        if os.path.exists(file_path):
-                            try:
-                                file_data = file_tool.read_json_file(file_path)
-                                if original_key in file_data:
-                                    translation_results[key] = file_data[original_key]
-                            except Exception as e:
-                                signal_bus.log_message.emit("ERROR", f"读取翻译文件 {zh_filename} 失败: {str(e)}", {})
+                    try:
+                        with os.scandir(i18n_path) as it:
+                            for entry in it:
+                                if entry.name.lower() == 'zh' and entry.is_dir():
+                                    zh_folder = entry.path
+                                    break
+                    except (FileNotFoundError, NotADirectoryError):
+                        continue
+                    if not zh_folder:
+                        continue
+                    file_path = os.path.join(zh_folder, zh_filename)
+                    display_name = zh_filename
+                else:
+                    continue
+                
+                if os.path.exists(file_path):
+                    sources.append((display_name, file_path, keys))
+            
+            results = _read_json_files([source[1] for source in sources])
+            for (display_name, _, keys), (file_data, error) in zip(sources, results):
+                if error is not None:
+                    if display_name is None:
+                        signal_bus.log_message.emit("ERROR", f"读取翻译文件失败: {str(error)}", {})
+                    else:
+                        signal_bus.log_message.emit("ERROR", f"读取翻译文件 {display_name} 失败: {str(error)}", {})
+                    continue
+                for key, original_key in keys:
+                    if original_key in file_data:
+                        translation_results[key] = file_data[original_key]
             
             # 更新质量检查窗口的新翻译列
             if translation_results:
@@ -1393,7 +1626,7 @@ class OneClickUpdateProcessor:
                 # 如果目标文件已存在，先删除它
                 if os.path.exists(new_path):
                     os.remove(new_path)
-                    signal_bus.log_message.emit("INFO", f"删除已存在的文件: {os.path.basename(new_path)}", {})
+                    self._log("INFO", f"删除已存在的文件: {os.path.basename(new_path)}")
                 
                 # 重命名文件
                 os.rename(old_path, new_path)
@@ -1418,7 +1651,7 @@ class OneClickUpdateProcessor:
                     filtered_data[key] = value
             
             if not filtered_data:
-                signal_bus.log_message.emit("INFO", "配置菜单翻译结果已全部存在于zh.json中", {})
+                self._log("INFO", "配置菜单翻译结果已全部存在于zh.json中")
                 return
             
             # 读取zh.json的原始文本内容
@@ -1452,13 +1685,13 @@ class OneClickUpdateProcessor:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     f.write('\n'.join(zh_lines))
                 
-                signal_bus.log_message.emit("SUCCESS", f"配置菜单翻译结果已追加到zh.json，共{len(filtered_data)}项", {})
+                self._log("SUCCESS", f"配置菜单翻译结果已追加到zh.json，共{len(filtered_data)}项")
             else:
                 # 无法找到插入位置，直接追加
                 with open(output_file, 'a', encoding='utf-8') as f:
                     f.write('\n' + insert_content)
                 
-                signal_bus.log_message.emit("SUCCESS", f"配置菜单翻译结果已追加到zh.json，共{len(filtered_data)}项", {})
+                self._log("SUCCESS", f"配置菜单翻译结果已追加到zh.json，共{len(filtered_data)}项")
     
     def _copy_other_files(self, en_mod_path: str, zh_mod_path: str, output_dir: str):
         """复制其他文件（Portraits和config.json）"""
@@ -1482,12 +1715,12 @@ class OneClickUpdateProcessor:
                     zh_manifest = os.path.join(zh_dir, 'manifest.json')
                     if os.path.exists(zh_manifest):
                         os.remove(zh_manifest)
-                        signal_bus.log_message.emit("DEBUG", f"清理ZH文件夹中的manifest.json", {})
+                        self._log("DEBUG", f"清理ZH文件夹中的manifest.json")
                     
                     zh_content = os.path.join(zh_dir, 'content.json')
                     if os.path.exists(zh_content):
                         os.remove(zh_content)
-                        signal_bus.log_message.emit("DEBUG", f"清理ZH文件夹中的content.json", {})
+                        self._log("DEBUG", f"清理ZH文件夹中的content.json")
             
             # 复制Portraits文件夹（仅在zh_mod_path存在时执行）
             if zh_mod_path:
@@ -1498,7 +1731,7 @@ class OneClickUpdateProcessor:
                     os.makedirs(en_portraits, exist_ok=True)
                     # 直接复制覆盖，保留新版本中可能存在的新文件
                     self._copy_directory_contents(zh_portraits, en_portraits)
-                    signal_bus.log_message.emit("SUCCESS", "Portraits文件夹复制完成", {})
+                    self._log("SUCCESS", "Portraits文件夹复制完成")
             
             # 复制config.json文件（仅在zh_mod_path存在时执行）
             if zh_mod_path:
@@ -1506,10 +1739,10 @@ class OneClickUpdateProcessor:
                 if os.path.exists(zh_config):
                     en_config = os.path.join(output_dir, 'config.json')
                     shutil.copy2(zh_config, en_config)
-                    signal_bus.log_message.emit("SUCCESS", "config.json文件复制完成", {})
+                    self._log("SUCCESS", "config.json文件复制完成")
             
         except Exception as e:
-            signal_bus.log_message.emit("ERROR", f"复制其他文件失败: {str(e)}", {})
+            self._log("ERROR", f"复制其他文件失败: {str(e)}")
     
     def _copy_directory_contents(self, src_dir: str, dst_dir: str):
         """递归复制目录内容，保留目标目录中已存在但源目录中不存在的文件"""
@@ -1529,7 +1762,7 @@ class OneClickUpdateProcessor:
                     # 如果是文件，直接复制覆盖
                     shutil.copy2(src_path, dst_path)
         except Exception as e:
-            signal_bus.log_message.emit("ERROR", f"复制目录内容失败: {str(e)}", {})
+            self._log("ERROR", f"复制目录内容失败: {str(e)}")
             raise
     
     def _validate_folder_names(self, en_paths: List[str], zh_paths: List[str]) -> bool:
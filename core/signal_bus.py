@@ -15,6 +15,7 @@ class SignalBus(QObject):
     batch_started = Signal(int, int)  # 批次开始: 当前批次, 总批次数
     # file_tool，project_manager,tab_smart
     log_message = Signal(str, str, dict)   # 级别('信息', '警告', '错误', '成功'), 消息, 详情
+    log_batch = Signal(list)  # 批量日志: [(级别, 消息, 详情), ...]，后台热路径合并发送
     # settings_dialog
     settingsSaved = Signal(dict)  # 设置保存信号
     cacheCleared = Signal(object)  # 缓存清除信号
@@ -191,8 +191,9 @@ class TranslationExecutor:
             output_folder = params.get('输出文件夹', '')
             zh_folder = self.project_manager.get_folder_path('zh') if self.project_manager else None
 
-            # 获取所有源文件
-            source_files = file_tool.get_all_json_files(source_folder)
+            # 获取并并发读取所有源文件
+            source_data = file_tool.read_all_json_files(source_folder)
+            source_files = list(source_data)
             if not source_files:
                 return {'成功': False, '消息': '未找到源文件'}
             
@@ -207,12 +208,9 @@ class TranslationExecutor:
                 # 使用唯一文件名（包含相对路径）避免重复
                 unique_filename = str(Path(src_file).relative_to(source_folder))
                 
-                # 读取文件获取总项数
-                try:
-                    data = file_tool.read_json_file(src_file)
-                    total_items = len(data) if isinstance(data, dict) else 0
-                except:
-                    total_items = 0
+                # 根据预读的数据获取总项数
+                data = source_data[src_file]
+                total_items = len(data) if isinstance(data, dict) else 0
                 
                 # 添加文件到进度跟踪
                 signal_bus.translation_started.emit(unique_filename, total_items)
@@ -233,8 +231,10 @@ class TranslationExecutor:
                     # 发送文件进度（开始）
                     signal_bus.translation_progress.emit(unique_filename, 0, "开始处理")
                     
-                    # 读取源文件
-                    data = file_tool.read_json_file(src_file)
+                    # 使用预读的源文件数据，预读失败时重新读取以记录具体错误
+                    data = source_data[src_file]
+                    if data is None:
+                        data = file_tool.read_json_file(src_file)
                     
                     if not isinstance(data, dict):
                         signal_bus.log_message.emit("ERROR", f"文件 {unique_filename} 不是有效的字典格式", {})
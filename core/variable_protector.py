@@ -3,6 +3,88 @@ import re
 import itertools
 from typing import Tuple, Dict
 
+# 星露谷对话格式的变量正则表达式（按6,5,1,2,3,7,4顺序，已优化）
+_VARIABLE_PATTERNS = (
+    # 6. 复杂命令（较少使用）
+    r'\$[cq]\s+[^#]*#',  # 合并 $c 和 $q 命令
+    r'\$[rp]\s+[^#]*#',  # 合并 $r 和 $p 命令
+    r'\$d\s+[^#]*#',    # 世界状态 $d kent
+    
+    # 5. 特殊格式
+    r'\$\{[^}]*\^[^}]*\}',  # 性别开关 ${male^female}
+    r'\{\{[^}]*\}\}',       # {{...}}
+    r'\$\{[^}]*\}',        # ${...}}
+    r'\|\||\*|\^',          # 合并特殊字符：||, *, ^
+    
+    # 1. 基本对话命令（最常用的）
+    r'#\$[be]#',  # 合并 #$e# 和 #$b#
+    r'\$[be]',    # 合并 $e 和 $b
+    
+    # 2. 肖像命令（情绪表达）
+    r'\$[hsluak]',  # 合并所有字母肖像命令：h,s,l,u,a,k
+    r'\$\d+',      # 数字肖像
+    
+    # 3. 物品给予
+    r'\[[^\]]+\+?]',  # 合并 [item...] 和 [item...+]
+    
+    # 7. 替换命令（占位符）- 优化分组
+    # 特殊字符
+    r'@',
+    # %变量 - 只保护特定的系统变量，不保护NPC名字
+    r'%fork|%item.*?%%',  # 特殊%变量
+    # 明确列出需要保护的系统变量
+    r'%spouse|%name|%time|%band|%book|%place|%adj|%noun',  # 长变量名
+    r'%kid1|%kid2|%pet|%farm',  # 中等变量名
+    r'%firstnameletter',   # 特殊情况
+    r'%favorite',         # 特殊情况
+    r'%',  # 保护%符号本身，防止AI误解为特殊变量（放在最后确保先匹配完整变量名）
+    
+    # 4. 保留的原有模式（向后兼容）
+    r'\$\{\{[^{}]*?\}\}\s*#',  # ${...} #
+    r'\$\{\{[^{}]*?\}}#',  # ${...}#
+    r'\$[A-Za-z0-9_]+',  # 其他$变量（增加下划线支持）
+)
+
+
+def _leading_chars(patterns) -> str:
+    """从变量模式推导所有可能的首字符；某个分支不以字面字符开头时报错，避免预过滤漏掉变量"""
+    chars = set()
+    for pattern in patterns:
+        # 按顶层的 | 拆分分支（跳过转义字符和字符类中的 |）
+        branches, depth, in_class, escaped, current = [], 0, False, False, ''
+        for c in pattern:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif in_class:
+                in_class = c != ']'
+            elif c == '[':
+                in_class = True
+            elif c == '(':
+                depth += 1
+            elif c == ')':
+                depth -= 1
+            elif c == '|' and depth == 0:
+                branches.append(current)
+                current = ''
+                continue
+            current += c
+        branches.append(current)
+        for branch in branches:
+            if branch[:1] == '\\' and len(branch) > 1 and not branch[1].isalnum():
+                first, rest = branch[1], branch[2:]
+            elif branch and branch[0] not in '\\[(.^$?*+{':
+                first, rest = branch[0], branch[1:]
+            else:
+                first, rest = None, ''
+            # 首字符可省略（后跟 ? 或 *）时同样无法确定
+            if first is None or rest[:1] in ('?', '*'):
+                raise ValueError(f"无法确定变量模式的首字符: {pattern!r}")
+            chars.add(first)
+    return ''.join(sorted(chars))
+
+
 class VariableProtector:
     """变量保护器，使用全局短标记"""
     
@@ -11,49 +93,11 @@ class VariableProtector:
     _marker_to_var = {}  # 全局标记 -> 原始变量（反向映射）
     _marker_gen = None  # 全局标记生成器
     _marker_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    # 所有变量模式可能的首字符，文本中不含这些字符时一定没有变量（由模式列表推导）
+    _sentinel_chars = _leading_chars(_VARIABLE_PATTERNS)
 
     def __init__(self):
-        # 星露谷对话格式的变量正则表达式（按6,5,1,2,3,7,4顺序，已优化）
-        self.variable_patterns = [
-            # 6. 复杂命令（较少使用）
-            r'\$[cq]\s+[^#]*#',  # 合并 $c 和 $q 命令
-            r'\$[rp]\s+[^#]*#',  # 合并 $r 和 $p 命令
-            r'\$d\s+[^#]*#',    # 世界状态 $d kent
-            
-            # 5. 特殊格式
-            r'\$\{[^}]*\^[^}]*\}',  # 性别开关 ${male^female}
-            r'\{\{[^}]*\}\}',       # {{...}}
-            r'\$\{[^}]*\}',        # ${...}}
-            r'\|\||\*|\^',          # 合并特殊字符：||, *, ^
-            
-            # 1. 基本对话命令（最常用的）
-            r'#\$[be]#',  # 合并 #$e# 和 #$b#
-            r'\$[be]',    # 合并 $e 和 $b
-            
-            # 2. 肖像命令（情绪表达）
-            r'\$[hsluak]',  # 合并所有字母肖像命令：h,s,l,u,a,k
-            r'\$\d+',      # 数字肖像
-            
-            # 3. 物品给予
-            r'\[[^\]]+\+?]',  # 合并 [item...] 和 [item...+]
-            
-            # 7. 替换命令（占位符）- 优化分组
-            # 特殊字符
-            r'@',
-            # %变量 - 只保护特定的系统变量，不保护NPC名字
-            r'%fork|%item.*?%%',  # 特殊%变量
-            # 明确列出需要保护的系统变量
-            r'%spouse|%name|%time|%band|%book|%place|%adj|%noun',  # 长变量名
-            r'%kid1|%kid2|%pet|%farm',  # 中等变量名
-            r'%firstnameletter',   # 特殊情况
-            r'%favorite',         # 特殊情况
-            r'%',  # 保护%符号本身，防止AI误解为特殊变量（放在最后确保先匹配完整变量名）
-            
-            # 4. 保留的原有模式（向后兼容）
-            r'\$\{\{[^{}]*?\}\}\s*#',  # ${...} #
-            r'\$\{\{[^{}]*?\}}#',  # ${...}#
-            r'\$[A-Za-z0-9_]+',  # 其他$变量（增加下划线支持）
-        ]
+        self.variable_patterns = list(_VARIABLE_PATTERNS)
         
         self.compiled_pattern = re.compile('|'.join(self.variable_patterns))
         self.pattern_string = '|'.join(self.variable_patterns)
@@ -142,3 +186,8 @@ class VariableProtector:
         """获取变量re规则"""
         return self.pattern_string
 
+    @classmethod
+    def get_sentinel_chars(cls) -> str:
+        """获取变量模式可能的首字符"""
+        return cls._sentinel_chars
+
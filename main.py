@@ -66,8 +66,38 @@ def initialize_user_directories():
         return False
 
 
+def run_self_test():
+    """无界面自检：跑一遍术语匹配、变量保护和提示词构建（供 PGO 训练使用）"""
+    from core.config import get_resource_path
+    from core.file_tool import file_tool
+    from core.terminology_manager import TerminologyManager
+    from core.variable_protector import VariableProtector
+
+    terminology_manager = TerminologyManager("translation_prompt")
+    terminology_data = file_tool.read_json_file(str(get_resource_path("resources/terminology.json")))
+    for en_term, zh_term in terminology_data.items():
+        terminology_manager.add_terminology(en_term, zh_term)
+
+    samples = [
+        "Hi @! Did you bring me a [128 Pufferfish]?$h#$b#I love %favorite.",
+        "${Mr.^Ms.} %name, the %spouse is waiting at %farm Farm.$s",
+        "I'll see you at the Saloon tonight, {{PlayerName}}.$0",
+    ]
+    variable_protector = VariableProtector()
+    protected_texts = [variable_protector.protect_variables(text)[0] for text in samples]
+    terminology_manager.build_translation_prompt(protected_texts)
+    for protected in protected_texts:
+        variable_protector.restore_variables(protected)
+
+    print("✅ 自检完成")
+    return 0
+
+
 def main():
     """主函数"""
+    if "--self-test" in sys.argv:
+        return run_self_test()
+
     # 显示启动信息
     show_splash_info()
 
@@ -98,9 +98,9 @@ class StardewTranslationTool(QMainWindow):
         self.setStyleSheet(get_main_window_style(config.theme))
 
 
-    @Slot(str, str, dict)
-    def on_log_message(self, level: str, message: str, detail: dict = None):
-        """接收并显示日志"""
+    @staticmethod
+    def _format_log_line(level: str, message: str, detail: dict = None) -> str:
+        """生成一行日志文本"""
         # 为没有图标的类型返回空字符串
         icon_map = {"INFO": "🔵", "SUCCESS": "✅", "WARNING": "⚠️", "ERROR": "❌", "DEBUG": "🔍", "NONE": ""}
         icon = icon_map.get(level, "📝")
@@ -109,9 +109,20 @@ class StardewTranslationTool(QMainWindow):
 
         # 如果有图标则添加空格，没有则不加
         if icon:
-            self.log_text.append(f"{icon} {message}{detail_text}")
-        else:
-            self.log_text.append(f"{message}{detail_text}")
+            return f"{icon} {message}{detail_text}"
+        return f"{message}{detail_text}"
+
+    @Slot(str, str, dict)
+    def on_log_message(self, level: str, message: str, detail: dict = None):
+        """接收并显示日志"""
+        self.log_text.append(self._format_log_line(level, message, detail))
+        self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
+
+    @Slot(list)
+    def on_log_batch(self, records: list):
+        """接收并显示一批日志，整批只滚动一次"""
+        for level, message, detail in records:
+            self.log_text.append(self._format_log_line(level, message, detail))
         self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
 
     def init_ui(self):
@@ -260,6 +271,7 @@ class StardewTranslationTool(QMainWindow):
         # 连接翻译信号
         self._connect_translation_signals()
         signal_bus.log_message.connect(self.on_log_message)
+        signal_bus.log_batch.connect(self.on_log_batch)
         
         # 输出启动信息到日志
         signal_bus.log_message.emit("NONE", "✅ 应用程序启动完成", {})
@@ -829,7 +841,7 @@ class StardewTranslationTool(QMainWindow):
             # 遍历所有修复，收集需要更新的数据
             for key, fix_data in fixes.items():
                 new_translation = fix_data.get('新翻译', '')
-                original_key = fix_data.get('键', key)  # 如果有原始键则使用，否则使用哈希键
+                original_key = fix_data.get('键', key)  # 如果有原始键则使用，否则使用合并键
                 mod_name = fix_data.get('mod_name', '')
                 filename = fix_data.get('filename', '')
                 source_file = fix_data.get('原始文件', '')  # 兼容质量检查标签页的格式
@@ -861,7 +873,7 @@ class StardewTranslationTool(QMainWindow):
                     else:
                         target_file = os.path.join(i18n_path, filename)
 
-                    # 通过哈希键在mod_mapping中查找原始键
+                    # 通过合并键（mod名/键名）在mod_mapping中查找原始键
                     lookup_key = original_key
                     # 从translation_executor获取mod_mapping
                     if (hasattr(self.translation_executor, '_current_processor') and 
@@ -1048,16 +1060,16 @@ class StardewTranslationTool(QMainWindow):
             # 通知处理器继续执行
             if hasattr(self, 'translation_executor') and hasattr(self.translation_executor, '_current_processor'):
                 processor = self.translation_executor._current_processor
-                if hasattr(processor, '_user_processed'):
-                    processor._user_processed.set()
+                if hasattr(processor, 'mark_user_processed'):
+                    processor.mark_user_processed()
                 
         except Exception as e:
             signal_bus.log_message.emit("ERROR", f"处理人名地名检测结果失败: {str(e)}", {})
             # 即使出错也要继续执行
             if hasattr(self, 'translation_executor') and hasattr(self.translation_executor, '_current_processor'):
                 processor = self.translation_executor._current_processor
-                if hasattr(processor, '_user_processed'):
-                    processor._user_processed.set()
+                if hasattr(processor, 'mark_user_processed'):
+                    processor.mark_user_processed()
 
     def on_update_available(self, update_info):
         """处理有新版本可用的通知"""
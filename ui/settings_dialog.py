@@ -280,6 +280,13 @@ class GlobalSettingsDialog(QDialog):
             layout_item.addStretch()
             batch_layout.addLayout(layout_item)
 
+        # 是否输出调试日志
+        from PySide6.QtWidgets import QCheckBox
+        self.debug_log_checkbox = QCheckBox("输出调试日志")
+        self.debug_log_checkbox.setChecked(config.log_level == "DEBUG")
+        self.debug_log_checkbox.setToolTip("关闭后一键更新不再输出逐项的调试信息，处理大量mod时更快")
+        batch_layout.addWidget(self.debug_log_checkbox)
+
         layout.addWidget(batch_group)
 
         # 背景图片设置组
@@ -287,7 +294,6 @@ class GlobalSettingsDialog(QDialog):
         bg_layout = QVBoxLayout(bg_group)
 
         # 是否使用背景图片
-        from PySide6.QtWidgets import QCheckBox
         use_bg_layout = QHBoxLayout()
         self.use_background_checkbox = QCheckBox("使用背景图片")
         self.use_background_checkbox.setChecked(config.use_background)
@@ -700,9 +706,10 @@ class GlobalSettingsDialog(QDialog):
                 break
         
         # 加载该提供商的配置
-        self.api_key_edit.setText(config.api_keys.get(provider, ""))
-        self.api_url_edit.setText(config.api_urls.get(provider, ""))
-        self.api_model_edit.setText(config.api_models.get(provider, ""))
+        provider_cfg = config.get_provider_config(provider)
+        self.api_key_edit.setText(provider_cfg.key)
+        self.api_url_edit.setText(provider_cfg.url)
+        self.api_model_edit.setText(provider_cfg.model)
 
         # 提示词
         self._load_default_prompt(silent=True)
@@ -729,9 +736,10 @@ class GlobalSettingsDialog(QDialog):
             return
         
         # 加载该提供商的配置
-        self.api_key_edit.setText(config.api_keys.get(provider_code, ""))
-        self.api_url_edit.setText(config.api_urls.get(provider_code, ""))
-        self.api_model_edit.setText(config.api_models.get(provider_code, ""))
+        provider_cfg = config.get_provider_config(provider_code)
+        self.api_key_edit.setText(provider_cfg.key)
+        self.api_url_edit.setText(provider_cfg.url)
+        self.api_model_edit.setText(provider_cfg.model)
         
         # 更新帮助文本
         self._update_api_help_text(provider_code)
@@ -1038,6 +1046,7 @@ class GlobalSettingsDialog(QDialog):
         config.api_timeout = self.api_timeout_spin.value()
         config.temperature = self.temperature_spin.value() / 100.0
         config.use_background = self.use_background_checkbox.isChecked()
+        config.log_level = "DEBUG" if self.debug_log_checkbox.isChecked() else "INFO"
         config.custom_background_light = self.custom_bg_light_edit.text().strip()
         config.custom_background_dark = self.custom_bg_dark_edit.text().strip()
 